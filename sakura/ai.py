@@ -1,37 +1,70 @@
 """Ollama integration for Sakura."""
 
+import functools
 import logging
 import random
 import re
+from collections.abc import Callable, Iterable
 
 import ollama
 
-from .config import OLLAMA_MODEL, SYSTEM_PROMPT, EMOTIONS, EMOTION_ALIASES, GREETING_PROMPT, GREETINGS
+from .config import (
+    OLLAMA_MODEL,
+    OLLAMA_KEEP_ALIVE,
+    SYSTEM_PROMPT,
+    CANONICAL_EMOTION,
+    GREETING_PROMPT,
+    GREETINGS,
+)
 
 logger = logging.getLogger(__name__)
 
+# GREETING_PROMPT split around its only placeholder, so building it is a plain concat
+_GREETING_PREFIX, _GREETING_SUFFIX = GREETING_PROMPT.split("{memory_context}", 1)
 
-def _normalize_emotion(emotion: str) -> str:
-    """Map emotion aliases to valid emotions."""
-    emotion = emotion.lower()
-    return EMOTION_ALIASES.get(emotion, emotion)
+# Precompiled patterns for response parsing (hot path, runs every LLM turn)
+_RESPONSE_SCAN_RE = re.compile(
+    r'\[EMOTION:(?:\[EMOTION:)?(\w+)[^\]]*\]\s*'  # [EMOTION:name ...] (+ doubled prefix tag)
+    r'|\[(?:\w+:)?(\w+)\]',                       # alternate formats: [WORD:name], [name]
+    re.IGNORECASE,
+)
+# Any other [bracket] content, stripped from each half after the split
+_BRACKET_RE = re.compile(r'\[[^\]]+\]')
+_ACTION_RE = re.compile(r'(\*[^*]+\*)\s*')
+_DOUBLE_SPACE_RE = re.compile(r'  +')
+_JP_CHAR_RE = re.compile(r'[\u3040-\u30ff\u4e00-\u9fff]')  # hiragana, katakana, kanji
+# Both a JP char and an EN word (3+ letters) somewhere
+_BILINGUAL_RE = re.compile(r'(?=.*?[\u3040-\u30ff\u4e00-\u9fff])(?=.*?[a-zA-Z]{3})', re.DOTALL)
+# Greedy .* backtracks from the end, so this finds the LAST JP char/punctuation
+_LAST_JP_END_RE = re.compile(r'.*[\u3040-\u30ff\u4e00-\u9fff。、！？…]', re.DOTALL)
+
+
+def _to_canonical(emotion: str) -> str | None:
+    """Map an emotion or alias to a valid emotion, or None if unknown."""
+    return CANONICAL_EMOTION.get(emotion.lower())
 
 
 def _strip_duplicate_actions(text: str) -> str:
     """Remove duplicate *action* phrases, keeping first occurrence."""
     seen = set()
+    pieces: list[str] = []
+    last_end = 0
 
-    def replace_duplicate(match: re.Match) -> str:
+    # Match *action* patterns with optional trailing whitespace
+    for match in _ACTION_RE.finditer(text):
+        pieces.append(text[last_end:match.start()])
+        last_end = match.end()
         action = match.group(1).lower()  # Case-insensitive comparison
-        if action in seen:
-            return ""  # Remove duplicate (and trailing space if present)
-        seen.add(action)
-        return match.group(0)  # Keep original with any trailing space
+        if action not in seen:
+            seen.add(action)
+            pieces.append(match.group(0))  # Keep original with any trailing space
+        # Duplicates are dropped along with their trailing space
 
-    # Match *action* patterns with optional trailing whitespace
-    result = re.sub(r'(\*[^*]+\*)\s*', replace_duplicate, text)
+    pieces.append(text[last_end:])
+    result = "".join(pieces)
     # Clean up any double spaces left behind
-    result = re.sub(r'  +', ' ', result)
+    if "  " in result:
+        result = _DOUBLE_SPACE_RE.sub(' ', result)
     return result.strip()
 
 
@@ -44,19 +77,17 @@ def _ensure_separator(text: str) -> str:
     if "---" in text:
         return text
 
-    # Check for both Japanese and English content
-    jp_chars = r'[\u3040-\u30ff\u4e00-\u9fff]'  # hiragana, katakana, kanji
-    en_words = r'[a-zA-Z]{3,}'  # 3+ consecutive letters
-
-    if not (re.search(jp_chars, text) and re.search(en_words, text)):
+    # Cheap probe first: most unseparated responses are English-only
+    if not _JP_CHAR_RE.search(text):
         return text
 
-    # Find last Japanese character (including JP punctuation)
-    jp_end_pattern = r'[\u3040-\u30ff\u4e00-\u9fff。、！？…]'
+    # Check for both Japanese and English content
+    if not _BILINGUAL_RE.match(text):
+        return text
 
-    last_jp_pos = -1
-    for match in re.finditer(jp_end_pattern, text):
-        last_jp_pos = match.end()
+    # Find last Japanese character (including JP punctuation), scanning from the end
+    match = _LAST_JP_END_RE.match(text)
+    last_jp_pos = match.end() if match else -1
 
     if last_jp_pos > 0 and last_jp_pos < len(text) - 1:
         before = text[:last_jp_pos].strip()
@@ -92,23 +123,99 @@ _LOW_PRIORITY_KEYWORDS = {
 }
 
 
+_KEYWORD_TIERS = (_HIGH_PRIORITY_KEYWORDS, _MEDIUM_PRIORITY_KEYWORDS, _LOW_PRIORITY_KEYWORDS)
+
+# Per tier (HIGH first): (keyword, emotion) pairs in listing order
+_TIER_KEYWORDS: tuple[tuple[tuple[str, str], ...], ...] = tuple(
+    tuple(
+        (keyword, emotion)
+        for emotion, keywords in keywords_by_emotion.items()
+        for keyword in keywords
+    )
+    for keywords_by_emotion in _KEYWORD_TIERS
+)
+
+
+def _scan_response(response: str) -> tuple[str | None, str, str]:
+    """Strip tags/brackets and split on the first separator.
+
+    One scan extracts and strips emotion tags; the split and the removal of
+    other [bracket] content happen afterwards, so a bracket never hides a
+    separator. Returns (japanese, english, emotion). japanese is None when
+    no separator was found. emotion is "neutral" when no valid tag exists.
+    """
+    pieces: list[str] = []
+    tag_emotion: str | None = None
+    alt_emotion: str | None = None
+    last_end = 0
+
+    for match in _RESPONSE_SCAN_RE.finditer(response):
+        pieces.append(response[last_end:match.start()])
+        last_end = match.end()
+        tag, alt = match.group(1, 2)
+
+        if tag:
+            # First [EMOTION:...] tag wins, all of them are stripped
+            if tag_emotion is None:
+                tag_emotion = tag
+        else:
+            # Alternate formats are only stripped if they name a valid emotion
+            canonical = _to_canonical(alt)
+            if canonical is None:
+                pieces.append(match.group(0))
+            elif alt_emotion is None:
+                alt_emotion = canonical
+
+    pieces.append(response[last_end:])
+
+    emotion = "neutral"
+    if tag_emotion is not None:
+        emotion = _to_canonical(tag_emotion)
+        if emotion is None:
+            logger.warning(f"Invalid emotion '{tag_emotion}', defaulting to neutral")
+            emotion = "neutral"
+    elif alt_emotion is not None:
+        emotion = alt_emotion
+
+    # Em-dash counts as ---; split on the first separator only
+    text = "".join(pieces).replace("—", "---")
+    japanese, separator, english = text.partition("---")
+    if not separator:
+        return None, _strip_brackets(text), emotion
+    return _strip_brackets(japanese), _strip_brackets(english), emotion
+
+
+def _strip_brackets(text: str) -> str:
+    """Remove any remaining square bracket content."""
+    return _BRACKET_RE.sub('', text) if '[' in text else text
+
+
 def detect_emotion_from_text(text: str) -> str | None:
     """Detect emotion from English text using keyword matching.
 
     Checks priority tiers in order: HIGH → MEDIUM → LOW.
+    Within a tier, the keyword appearing earliest in the text wins.
     Returns first matched emotion or None.
     """
     text_lower = text.lower()
 
-    for tier in (_HIGH_PRIORITY_KEYWORDS, _MEDIUM_PRIORITY_KEYWORDS, _LOW_PRIORITY_KEYWORDS):
-        for emotion, keywords in tier.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return emotion
+    for keywords in _TIER_KEYWORDS:
+        # Earliest keyword in this tier; `in` and str.find both run in C
+        best = None
+        for keyword, emotion in keywords:
+            if keyword in text_lower:
+                position = text_lower.find(keyword)
+                if best is None or position < best_position:
+                    best_position, best = position, emotion
+        if best:
+            return best
 
     return None
 
 
+# Pure function of the raw response; repeats (retries, cold-start greetings) hit the cache.
+# Parse warnings are only logged on the first (uncached) call.
+@functools.lru_cache(maxsize=256)
 def parse_bilingual_response(response: str) -> tuple[str, str, str]:
     """Parse bilingual response with emotion tag.
 
@@ -134,59 +241,14 @@ def parse_bilingual_response(response: str) -> tuple[str, str, str]:
     # Try to insert --- separator if missing but both JP/EN present
     response = _ensure_separator(response)
 
-    emotion = "neutral"
-
-    # Dedupe if prefix prompting caused double emotion tag
-    response = re.sub(r'\[EMOTION:\[EMOTION:', '[EMOTION:', response, flags=re.IGNORECASE)
-
-    # Normalize em-dash to triple hyphen
-    response = response.replace("—", "---")
-
-    # Find emotion tag ANYWHERE in text (not just start)
-    # Capture only first word after EMOTION: (ignore commas, spaces, extra content)
-    emotion_pattern = r'\[EMOTION:(\w+)[^\]]*\]'
-    emotion_matches = re.findall(emotion_pattern, response, re.IGNORECASE)
-    if emotion_matches:
-        emotion = _normalize_emotion(emotion_matches[0])  # Use first found
-        if emotion not in EMOTIONS:
-            logger.warning(f"Invalid emotion '{emotion}', defaulting to neutral")
-            emotion = "neutral"
-    else:
-        # Try alternate formats: [WORD:name] or [name] anywhere in text
-        alt_pattern = r'\[(?:\w+:)?(\w+)\]'
-        alt_matches = re.findall(alt_pattern, response)
-        for match in alt_matches:
-            potential_emotion = _normalize_emotion(match)
-            if potential_emotion in EMOTIONS:
-                emotion = potential_emotion
-                break
-
-    # Strip ALL emotion tags from response body (including multi-word variants)
-    response = re.sub(r'\[EMOTION:\w+[^\]]*\]\s*', '', response, flags=re.IGNORECASE)
-
-    # Strip alternate emotion formats that match valid emotions
-    def strip_if_emotion(m: re.Match) -> str:
-        word = m.group(1)
-        if _normalize_emotion(word) in EMOTIONS:
-            return ''
-        return m.group(0)  # Keep non-emotion brackets
-
-    response = re.sub(r'\[(?:\w+:)?(\w+)\]', strip_if_emotion, response)
-
-    # Split on --- separator
-    if "---" in response:
-        parts = response.split("---", 1)  # Split on first occurrence only
-        japanese = parts[0].strip()
-        english = parts[1].strip() if len(parts) > 1 else ""
-    else:
+    # Extract first emotion tag, strip all tags/brackets, split on ---
+    japanese, english, emotion = _scan_response(response)
+    if japanese is None:
         # No separator found - treat entire response as English (fallback)
         logger.warning("No --- separator found in response, treating as English only")
         japanese = ""
-        english = response.strip()
-
-    # Strip any remaining square bracket content from displayed text
-    japanese = re.sub(r'\[[^\]]+\]', '', japanese).strip()
-    english = re.sub(r'\[[^\]]+\]', '', english).strip()
+    japanese = japanese.strip()
+    english = english.strip()
 
     # Fallback: detect emotion from English text if no tag was found
     if emotion == "neutral":
@@ -202,15 +264,80 @@ def parse_bilingual_response(response: str) -> tuple[str, str, str]:
     return japanese, english, emotion
 
 
+def warmup() -> None:
+    """Load the model into Ollama's memory ahead of the first request.
+
+    An empty prompt loads the model without generating anything.
+    Failures are ignored - the first real request will load it instead.
+    """
+    try:
+        ollama.generate(model=OLLAMA_MODEL, prompt="", keep_alive=OLLAMA_KEEP_ALIVE)
+        logger.debug(f"Warmed up {OLLAMA_MODEL}")
+    except Exception as e:
+        logger.debug(f"Ollama warmup failed: {e}")
+
+
+def _leading_emotion(text: str) -> str | None:
+    """Return the emotion from a leading [EMOTION:name] tag if it is final.
+
+    Only valid, non-neutral tags are final: parse_bilingual_response may
+    still replace "neutral" with an emotion detected from the text.
+    """
+    match = _RESPONSE_SCAN_RE.match(text.lstrip())
+    if not match or not match.group(1):
+        return None
+    emotion = _to_canonical(match.group(1))
+    return emotion if emotion != "neutral" else None
+
+
+def _stream_chat(
+    messages: list[dict],
+    prefix: str = "",
+    on_emotion: Callable[[str], None] | None = None,
+) -> str:
+    """Stream a chat completion from Ollama and return the full text.
+
+    Args:
+        messages: Messages to send.
+        prefix: Text the model continues from (prefix prompting), prepended to the result.
+        on_emotion: Called once with the emotion as soon as the leading tag has streamed in.
+
+    Returns:
+        The raw response, including prefix.
+    """
+    chunks: list[str] = [prefix] if prefix else []
+    tag_closed = on_emotion is None
+
+    for chunk in ollama.chat(
+        model=OLLAMA_MODEL,
+        messages=messages,
+        stream=True,
+        keep_alive=OLLAMA_KEEP_ALIVE,
+    ):
+        content = chunk['message']['content']
+        chunks.append(content)
+
+        # Fire on_emotion the moment the leading tag closes, before the body arrives
+        if not tag_closed and "]" in content:
+            tag_closed = True
+            emotion = _leading_emotion("".join(chunks))
+            if emotion:
+                on_emotion(emotion)
+
+    return "".join(chunks)
+
+
 def generate_greeting(
     summary_data: dict | None,
-    recent_messages: list[dict]
+    recent_messages: list[dict],
+    on_emotion: Callable[[str], None] | None = None,
 ) -> tuple[str, str, str]:
     """Generate a context-aware greeting using memory.
 
     Args:
         summary_data: Summary dict with 'summary' and 'key_facts', or None
         recent_messages: Recent conversation messages
+        on_emotion: Optional callback fired early with the streamed emotion tag
 
     Returns:
         Tuple of (japanese_text, english_text, emotion).
@@ -219,42 +346,63 @@ def generate_greeting(
     if not summary_data and not recent_messages:
         return random.choice(GREETINGS)
 
-    # Build memory context
-    memory_context = ""
+    # Build memory context (collect parts, join once)
+    parts: list[str] = []
     if summary_data:
-        memory_context += f"Memory summary:\n{summary_data.get('summary', '')}\n"
+        parts.append(f"Memory summary:\n{summary_data.get('summary', '')}\n")
         if summary_data.get('key_facts'):
-            memory_context += "\nKey facts:\n"
-            memory_context += "\n".join(f"- {fact}" for fact in summary_data['key_facts'])
+            parts.append("\nKey facts:\n")
+            parts.append("\n".join(f"- {fact}" for fact in summary_data['key_facts']))
 
     if recent_messages:
         # Add last few messages for immediate context
-        memory_context += "\n\nRecent conversation:\n"
+        parts.append("\n\nRecent conversation:\n")
         for msg in recent_messages[-6:]:  # Last 3 exchanges
             role = "Goshujin-sama" if msg["role"] == "user" else "Sakura"
-            memory_context += f"{role}: {msg['content']}\n"
+            parts.append(f"{role}: {msg['content']}\n")
+
+    memory_context = "".join(parts)
 
-    prompt = GREETING_PROMPT.format(memory_context=memory_context)
+    prompt = _GREETING_PREFIX + memory_context + _GREETING_SUFFIX
 
     try:
-        response = ollama.chat(
-            model=OLLAMA_MODEL,
-            messages=[{"role": "user", "content": prompt}]
+        raw_response = _stream_chat(
+            [{"role": "user", "content": prompt}],
+            on_emotion=on_emotion,
         )
-        raw_response = response['message']['content']
         return parse_bilingual_response(raw_response)
     except Exception as e:
         logger.warning(f"Failed to generate greeting: {e}")
         return random.choice(GREETINGS)
 
 
-def generate_response(messages: list[dict], summary_data: dict | None = None) -> tuple[str, str, str]:
+@functools.lru_cache(maxsize=4)
+def _build_context_prompt(summary: str, key_facts: tuple[str, ...]) -> str:
+    """Build SYSTEM_PROMPT + memory context.
+
+    Cached because the summary only changes when summarization runs,
+    not on every turn.
+    """
+    parts = [SYSTEM_PROMPT, f"\n\nMemory of past conversations:\n{summary}"]
+    if key_facts:
+        parts.append("\n\nKey facts about Goshujin-sama:\n")
+        parts.append("\n".join(f"- {fact}" for fact in key_facts))
+    return "".join(parts)
+
+
+def generate_response(
+    messages: Iterable[dict],
+    summary_data: dict | None = None,
+    on_emotion: Callable[[str], None] | None = None,
+) -> tuple[str, str, str]:
     """Generate a response from Sakura.
 
     Args:
-        messages: List of message dicts with 'role' and 'content' keys.
-                  Roles are 'user' or 'assistant'.
+        messages: Message dicts with 'role' and 'content' keys, in order.
+                  Roles are 'user' or 'assistant'. Any iterable works; it
+                  is consumed once.
         summary_data: Optional summary dict with memory context.
+        on_emotion: Optional callback fired early with the streamed emotion tag.
 
     Returns:
         Tuple of (japanese_text, english_text, emotion).
@@ -262,23 +410,22 @@ def generate_response(messages: list[dict], summary_data: dict | None = None) ->
     # Build context prompt with memory if available
     context_prompt = SYSTEM_PROMPT
     if summary_data:
-        memory_context = f"\n\nMemory of past conversations:\n{summary_data.get('summary', '')}"
-        if summary_data.get('key_facts'):
-            memory_context += f"\n\nKey facts about Goshujin-sama:\n"
-            memory_context += "\n".join(f"- {fact}" for fact in summary_data['key_facts'])
-        context_prompt += memory_context
+        context_prompt = _build_context_prompt(
+            str(summary_data.get('summary', '')),
+            tuple(str(fact) for fact in summary_data.get('key_facts') or ()),
+        )
 
-    full_messages = [{"role": "system", "content": context_prompt}] + messages
+    # Built once and reused across retries
+    full_messages = [{"role": "system", "content": context_prompt}]
+    full_messages.extend(messages)
 
     # Prefix prompting: add partial assistant message to force format start
     full_messages.append({"role": "assistant", "content": "[EMOTION:"})
 
     for attempt in range(2):
         try:
-            response = ollama.chat(model=OLLAMA_MODEL, messages=full_messages)
-            raw_response = response['message']['content']
-            # Prepend the prefix we used (model continues from it)
-            raw_response = "[EMOTION:" + raw_response
+            # Stream with the prefix we used prepended (model continues from it)
+            raw_response = _stream_chat(full_messages, prefix="[EMOTION:", on_emotion=on_emotion)
             return parse_bilingual_response(raw_response)
         except Exception as e:
             if attempt == 0:
@@ -8,28 +8,44 @@ Usage:
     python -m sakura.animate --force      # Regenerate even if exists
     python -m sakura.animate --seed 123   # Custom seed
     python -m sakura.animate --image assets/cache/happy.png  # Custom source
+    python -m sakura.animate --compile    # torch.compile UNet/VAE (CUDA/CPU only;
+                                          # first run is slow, later runs hit the cache)
+    python -m sakura.animate --fast-vae   # Tiny VAE (TAESD), much faster decode
+    python -m sakura.animate --quantize   # int8 UNet weights via torchao (CUDA only)
+    python -m sakura.animate --no-cfg     # Skip classifier-free guidance (~2x faster)
+    python -m sakura.animate --internal-size 384  # Denoise smaller, upscale after
+    python -m sakura.animate --fast       # LCM-LoRA, 6 steps instead of 25
+    python -m sakura.animate --format webp  # Animated WebP instead of GIF
 """
 
 import argparse
+import inspect
 import logging
 import os
 import shutil
 import subprocess
+from typing import TYPE_CHECKING
 
+# torch/diffusers/PIL are imported lazily so --help and the "already exists"
+# exit don't pay seconds of import time. MPS fallback must be set before torch loads.
 os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
 
-import torch
-from diffusers import AnimateDiffVideoToVideoPipeline, DDIMScheduler, MotionAdapter
-from diffusers.utils import load_image
-from PIL import Image
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
+if TYPE_CHECKING:
+    import torch
+    from diffusers import AnimateDiffVideoToVideoPipeline
+    from PIL import Image
+
 from .config import (
     ANIMATE_BASE_MODEL,
+    ANIMATE_FAST_GUIDANCE_SCALE,
+    ANIMATE_FAST_NUM_STEPS,
     ANIMATE_FPS,
     ANIMATE_GUIDANCE_SCALE,
     ANIMATE_HEIGHT,
+    ANIMATE_LCM_LORA,
     ANIMATE_MOTION_ADAPTER,
     ANIMATE_NUM_FRAMES,
     ANIMATE_NUM_STEPS,
@@ -37,8 +53,10 @@ from .config import (
     ANIMATE_SEED,
     ANIMATE_SOURCE,
     ANIMATE_STRENGTH,
+    ANIMATE_TINY_VAE,
     ANIMATE_VAE,
     ANIMATE_WIDTH,
+    IMAGE_COMPILE_CACHE,
     IMAGE_DEVICE,
 )
 
@@ -56,11 +74,29 @@ NEGATIVE_PROMPT = (
     "worst quality, low quality, deformed, extra limbs"
 )
 
-MAX_GIF_SIZE = 10 * 1024 * 1024  # 10MB GitHub limit
-
+MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB GitHub limit (GIF or WebP)
+
+
+def load_pipeline(
+    device: str,
+    use_compile: bool = False,
+    fast_vae: bool = False,
+    quantize: bool = False,
+    fast: bool = False,
+) -> "AnimateDiffVideoToVideoPipeline":
+    """Load AnimateDiff video-to-video pipeline with MPS optimizations.
+
+    Args:
+        device: Torch device to run on ("mps", "cuda" or "cpu").
+        use_compile: Compile the UNet and VAE decoder with torch.compile.
+                 Ignored on MPS, where TorchInductor doesn't pay off.
+        fast_vae: Use the tiny distilled VAE (TAESD) instead of the full KL VAE.
+        quantize: Quantize UNet weights to int8 (CUDA only).
+        fast: Use LCM-LoRA + LCMScheduler for few-step sampling instead of DDIM.
+    """
+    import torch
+    from diffusers import AnimateDiffVideoToVideoPipeline, DDIMScheduler, MotionAdapter
 
-def load_pipeline(device: str) -> AnimateDiffVideoToVideoPipeline:
-    """Load AnimateDiff video-to-video pipeline with MPS optimizations."""
     console.print(f"[dim]Loading motion adapter: {ANIMATE_MOTION_ADAPTER}...[/dim]")
     adapter = MotionAdapter.from_pretrained(
         ANIMATE_MOTION_ADAPTER, torch_dtype=torch.float32
@@ -73,148 +109,377 @@ def load_pipeline(device: str) -> AnimateDiffVideoToVideoPipeline:
         torch_dtype=torch.float32,
     )
 
-    # Use recommended VAE for better color reproduction
-    from diffusers import AutoencoderKL
+    if fast_vae:
+        # Tiny distilled VAE: a handful of conv layers, decode is near-free
+        from diffusers import AutoencoderTiny
+
+        console.print(f"[dim]Loading tiny VAE: {ANIMATE_TINY_VAE}...[/dim]")
+        vae = AutoencoderTiny.from_pretrained(ANIMATE_TINY_VAE, torch_dtype=torch.float32)
+    else:
+        # Use recommended VAE for better color reproduction
+        from diffusers import AutoencoderKL
 
-    console.print(f"[dim]Loading VAE: {ANIMATE_VAE}...[/dim]")
-    vae = AutoencoderKL.from_pretrained(ANIMATE_VAE, torch_dtype=torch.float32)
+        console.print(f"[dim]Loading VAE: {ANIMATE_VAE}...[/dim]")
+        vae = AutoencoderKL.from_pretrained(ANIMATE_VAE, torch_dtype=torch.float32)
     pipe.vae = vae
 
-    pipe.scheduler = DDIMScheduler.from_pretrained(
-        ANIMATE_BASE_MODEL,
-        subfolder="scheduler",
-        clip_sample=False,
-        timestep_spacing="linspace",
-        beta_schedule="linear",
-        steps_offset=1,
-    )
+    if fast:
+        from diffusers import LCMScheduler
+
+        console.print(f"[dim]Loading LCM-LoRA: {ANIMATE_LCM_LORA}...[/dim]")
+        pipe.load_lora_weights(ANIMATE_LCM_LORA, adapter_name="lcm")
+        # Bake the LoRA into the weights so steps don't pay the extra matmuls
+        pipe.fuse_lora()
+        pipe.scheduler = LCMScheduler.from_config(
+            pipe.scheduler.config, beta_schedule="linear"
+        )
+    else:
+        pipe.scheduler = DDIMScheduler.from_pretrained(
+            ANIMATE_BASE_MODEL,
+            subfolder="scheduler",
+            clip_sample=False,
+            timestep_spacing="linspace",
+            beta_schedule="linear",
+            steps_offset=1,
+        )
 
     pipe = pipe.to(device)
 
-    # MPS memory optimizations
-    pipe.enable_attention_slicing()
-    pipe.enable_vae_slicing()
+    if device == "cuda":
+        # Fused SDPA attention + channels_last beat slicing when VRAM isn't the bottleneck
+        from diffusers.models.attention_processor import AttnProcessor2_0
+
+        pipe.unet.set_attn_processor(AttnProcessor2_0())
+        pipe.unet.to(memory_format=torch.channels_last)
+        pipe.vae.to(memory_format=torch.channels_last)
+    else:
+        # MPS memory optimizations
+        pipe.enable_attention_slicing()
+        pipe.enable_vae_slicing()
+
+    if quantize:
+        if device == "cuda":
+            quantize_unet(pipe)
+        else:
+            console.print("[dim]Skipping --quantize (CUDA only).[/dim]")
+
+    # Compile after quantizing so Inductor sees the int8 kernels
+    if use_compile:
+        if device == "mps":
+            console.print("[dim]Skipping torch.compile on MPS.[/dim]")
+        else:
+            compile_pipeline(pipe)
 
     console.print("[green]Pipeline loaded successfully.[/green]")
     return pipe
 
 
+def quantize_unet(pipe: "AnimateDiffVideoToVideoPipeline") -> bool:
+    """Quantize the UNet's linear weights to int8 in place with torchao.
+
+    Halves weight memory traffic per denoising step. Works on the motion UNet
+    as-is, unlike load-time bitsandbytes configs which only cover UNet2D.
+    Returns False if torchao isn't installed.
+    """
+    try:
+        from torchao.quantization import int8_weight_only, quantize_
+    except ImportError:
+        console.print("[yellow]torchao not installed, skipping --quantize.[/yellow]")
+        return False
+
+    console.print("[dim]Quantizing UNet weights to int8...[/dim]")
+    quantize_(pipe.unet, int8_weight_only())
+    return True
+
+
+def compile_pipeline(pipe: "AnimateDiffVideoToVideoPipeline") -> None:
+    """Compile the UNet (with motion modules) and VAE decoder with torch.compile.
+
+    Compilation happens lazily on the first pipeline call, so the first
+    generation pays the compile cost. Inductor artifacts are cached under
+    IMAGE_COMPILE_CACHE, so later runs skip most of it. Unsupported ops
+    fall back to eager.
+    """
+    import torch
+
+    console.print("[dim]Compiling UNet and VAE with torch.compile...[/dim]")
+
+    # Inductor reads this lazily, so setting it before the first compile is enough.
+    # setdefault: an explicit TORCHINDUCTOR_CACHE_DIR from the user still wins.
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(IMAGE_COMPILE_CACHE))
+    import torch._inductor.config as inductor_config
+
+    inductor_config.fx_graph_cache = True
+
+    # Fall back to eager instead of raising if Dynamo/Inductor can't handle something
+    torch._dynamo.config.suppress_errors = True
+
+    pipe.unet.to(memory_format=torch.channels_last)
+    # fullgraph=False: AnimateDiff motion modules cause graph breaks
+    pipe.unet = torch.compile(pipe.unet, mode="reduce-overhead", fullgraph=False)
+    pipe.vae.decode = torch.compile(pipe.vae.decode, mode="reduce-overhead")
+
+
+def encode_source_latents(
+    pipe: "AnimateDiffVideoToVideoPipeline",
+    source_image: "Image.Image",
+    num_frames: int,
+    strength: float,
+    num_steps: int,
+    generator: "torch.Generator",
+) -> "torch.Tensor":
+    """Encode the source image once and tile it into noised video latents.
+
+    Equivalent to the pipeline's own prepare_latents for a video of identical
+    frames, minus the (num_frames - 1) redundant VAE encodes.
+
+    Returns:
+        Latents shaped (batch, channels, frames, height, width).
+    """
+    import torch
+    from diffusers.utils.torch_utils import randn_tensor
+
+    device = pipe._execution_device
+
+    image = pipe.video_processor.preprocess(source_image).to(device=device, dtype=pipe.vae.dtype)
+    with torch.no_grad():
+        encoded = pipe.vae.encode(image)
+    # AutoencoderKL returns a distribution, AutoencoderTiny returns latents directly
+    if hasattr(encoded, "latent_dist"):
+        latent = encoded.latent_dist.sample(generator)
+    else:
+        latent = encoded.latents
+    latent = latent * pipe.vae.config.scaling_factor
+
+    # Every frame starts from the same latent (expand is a view, no copy)
+    latents = latent.unsqueeze(2).expand(-1, -1, num_frames, -1, -1)
+
+    # Noise to the timestep denoising starts from; per-frame noise is what creates motion
+    pipe.scheduler.set_timesteps(num_steps, device=device)
+    t_start = num_steps - min(int(num_steps * strength), num_steps)
+    latent_timestep = pipe.scheduler.timesteps[t_start * pipe.scheduler.order:][:1]
+    noise = randn_tensor(latents.shape, generator=generator, device=device, dtype=latents.dtype)
+    return pipe.scheduler.add_noise(latents, noise, latent_timestep)
+
+
 def generate_frames(
-    pipe: AnimateDiffVideoToVideoPipeline,
-    source_image: Image.Image,
+    pipe: "AnimateDiffVideoToVideoPipeline",
+    source_image: "Image.Image",
     num_frames: int,
     strength: float,
     seed: int,
-) -> list[Image.Image]:
-    """Generate animation frames from a single source image."""
-    # Duplicate image as a "video" input
-    video_input = [source_image] * num_frames
-
-    generator = torch.Generator(device="cpu").manual_seed(seed)
+    num_steps: int = ANIMATE_NUM_STEPS,
+    guidance_scale: float = ANIMATE_GUIDANCE_SCALE,
+) -> list["Image.Image"]:
+    """Generate animation frames from a single source image.
+
+    With guidance_scale <= 1.0 no negative prompt is sent, so diffusers runs
+    one UNet pass per step instead of a doubled CFG batch. The prompt itself
+    is encoded once per call either way.
+    """
+    import torch
+
+    # Sample noise on the compute device to avoid per-step host->device copies.
+    # MPS generators still aren't supported, so it stays on CPU there.
+    generator_device = "cuda" if pipe.device.type == "cuda" else "cpu"
+    generator = torch.Generator(device=generator_device).manual_seed(seed)
+
+    call_params = inspect.signature(pipe.__call__).parameters
+    if "latents" in call_params:
+        # Encode once and tile, instead of VAE-encoding the same frame N times
+        latents = encode_source_latents(
+            pipe, source_image, num_frames, strength, num_steps, generator
+        )
+        video_kwargs = {
+            "latents": latents,
+            "height": source_image.height,
+            "width": source_image.width,
+        }
+    else:
+        # Older diffusers: duplicate image as a "video" input
+        video_kwargs = {"video": [source_image] * num_frames}
+
+    if pipe.device.type == "cuda" and "decode_chunk_size" in call_params:
+        # Decode all frames in one batched VAE pass instead of serial chunks of 16
+        video_kwargs["decode_chunk_size"] = num_frames
 
     output = pipe(
-        video=video_input,
+        **video_kwargs,
         prompt=PROMPT,
-        negative_prompt=NEGATIVE_PROMPT,
+        negative_prompt=NEGATIVE_PROMPT if guidance_scale > 1.0 else None,
         strength=strength,
-        num_inference_steps=ANIMATE_NUM_STEPS,
-        guidance_scale=ANIMATE_GUIDANCE_SCALE,
+        num_inference_steps=num_steps,
+        guidance_scale=guidance_scale,
         generator=generator,
     )
 
     return output.frames[0]
 
 
+def _pingpong(frames: list["Image.Image"]):
+    """Yield forward + reverse frames (minus endpoints to avoid stutter)."""
+    yield from frames
+    yield from reversed(frames[1:-1])
+
+
+def _save_gif_vips(frames: list["Image.Image"], output_path: str, duration: int) -> bool:
+    """Save frames with libvips' cgif-based gifsave. Returns False if unavailable."""
+    try:
+        import pyvips
+    except (ImportError, OSError):
+        # OSError: pyvips installed but libvips itself missing
+        return False
+
+    width, height = frames[0].size
+    pages = [
+        pyvips.Image.new_from_memory(
+            frame.convert("RGB").tobytes(), width, height, 3, "uchar"
+        )
+        for frame in _pingpong(frames)
+    ]
+
+    # Animated images in vips are a vertical strip of pages
+    image = pyvips.Image.arrayjoin(pages, across=1).copy()
+    image.set_type(pyvips.GValue.gint_type, "page-height", height)
+    image.set_type(pyvips.GValue.array_int_type, "delay", [duration] * len(pages))
+    image.set_type(pyvips.GValue.gint_type, "loop", 0)
+    image.gifsave(output_path, dither=1.0, effort=7)
+    return True
+
+
 def save_gif(
-    frames: list[Image.Image],
+    frames: list["Image.Image"],
     output_path: str,
     fps: int,
-) -> int:
-    """Save frames as a ping-pong looping GIF. Returns file size in bytes."""
+) -> tuple[int, bool]:
+    """Save frames as a ping-pong looping GIF.
+
+    Uses libvips when pyvips is installed, otherwise PIL.
+
+    Returns:
+        Tuple of (file size in bytes, whether libvips wrote the file)
+    """
     duration = int(1000 / fps)
 
-    # Ping-pong: forward + reverse (minus endpoints to avoid stutter)
-    pingpong = list(frames) + list(reversed(frames[1:-1]))
+    used_vips = _save_gif_vips(frames, output_path, duration)
+    if not used_vips:
+        # Streamed to PIL as a generator so the frame list is never doubled
+        pingpong = _pingpong(frames)
+        first = next(pingpong)
+        first.save(
+            output_path,
+            save_all=True,
+            append_images=pingpong,
+            duration=duration,
+            loop=0,
+            optimize=True,
+            disposal=2,
+        )
+
+    file_size = os.path.getsize(output_path)
+    return file_size, used_vips
+
+
+def save_webp(
+    frames: list["Image.Image"],
+    output_path: str,
+    fps: int,
+) -> int:
+    """Save frames as a ping-pong looping animated WebP. Returns file size in bytes.
+
+    Full-color VP8 frames instead of a 256-color palette; typically several
+    times smaller than the GIF, so no gifsicle pass is needed.
+    """
+    duration = int(1000 / fps)
 
-    pingpong[0].save(
+    pingpong = _pingpong(frames)
+    first = next(pingpong)
+    first.save(
         output_path,
         save_all=True,
-        append_images=pingpong[1:],
+        append_images=pingpong,
         duration=duration,
         loop=0,
-        optimize=True,
-        disposal=2,
+        lossless=False,
+        quality=80,
+        method=6,
     )
 
-    file_size = os.path.getsize(output_path)
-    return file_size
+    return os.path.getsize(output_path)
+
 
+def compress_gif(gif_path: str, lossy: int | None = None) -> int | None:
+    """Recompress GIF with a single gifsicle pass. Returns new size or None.
 
-def optimize_gif(gif_path: str) -> int | None:
-    """Try to optimize GIF with gifsicle if available. Returns new size or None."""
+    Data is piped through stdin/stdout so the file is read and written once.
+    Lossless results are only kept if smaller; lossy results always replace.
+    """
     if not shutil.which("gifsicle"):
         console.print("[dim]gifsicle not found, skipping optimization.[/dim]")
         return None
 
-    optimized_path = str(gif_path) + ".opt"
+    cmd = ["gifsicle", "--optimize=3", "--colors=256"]
+    if lossy is not None:
+        cmd.append(f"--lossy={lossy}")
 
-    try:
-        subprocess.run(
-            [
-                "gifsicle",
-                "--optimize=3",
-                "--colors=256",
-                "-o",
-                optimized_path,
-                gif_path,
-            ],
-            check=True,
-            capture_output=True,
-        )
+    with open(gif_path, "rb") as f:
+        original = f.read()
 
-        optimized_size = os.path.getsize(optimized_path)
-        original_size = os.path.getsize(gif_path)
-
-        if optimized_size < original_size:
-            os.replace(optimized_path, gif_path)
-            return optimized_size
-        else:
-            os.remove(optimized_path)
-            return original_size
+    try:
+        result = subprocess.run(cmd, input=original, check=True, capture_output=True)
     except (subprocess.CalledProcessError, FileNotFoundError):
-        if os.path.exists(optimized_path):
-            os.remove(optimized_path)
         return None
 
+    compressed = result.stdout
+    if lossy is None and len(compressed) >= len(original):
+        return len(original)
 
-def lossy_compress_gif(gif_path: str, lossy: int = 20) -> int | None:
-    """Apply lossy compression with gifsicle. Returns new size or None."""
-    if not shutil.which("gifsicle"):
-        return None
+    with open(gif_path, "wb") as f:
+        f.write(compressed)
+    return len(compressed)
 
-    optimized_path = str(gif_path) + ".opt"
 
-    try:
-        subprocess.run(
-            [
-                "gifsicle",
-                "--optimize=3",
-                "--colors=256",
-                f"--lossy={lossy}",
-                "-o",
-                optimized_path,
-                gif_path,
-            ],
-            check=True,
-            capture_output=True,
+def write_gif(frames: list["Image.Image"], output_path: str, fps: int) -> int:
+    """Save a GIF and squeeze it under the GitHub limit. Returns final size."""
+    pingpong_count = len(frames) + max(0, len(frames) - 2)
+
+    console.print("[dim]Saving GIF...[/dim]")
+    file_size, used_vips = save_gif(frames, output_path, fps=fps)
+    console.print(
+        f"[dim]Raw GIF: {format_size(file_size)} "
+        f"({pingpong_count} frames, {fps} FPS"
+        f"{', libvips' if used_vips else ''})[/dim]"
+    )
+
+    # Optimize if possible. cgif already quantizes well, so skip after vips;
+    # oversized files skip straight to the lossy pass below (it optimizes too).
+    if not used_vips and file_size <= MAX_FILE_SIZE:
+        optimized_size = compress_gif(output_path)
+        if optimized_size is not None and optimized_size != file_size:
+            console.print(
+                f"[dim]Optimized: {format_size(file_size)} → "
+                f"{format_size(optimized_size)}[/dim]"
+            )
+            file_size = optimized_size
+
+    # Check against GitHub limit
+    if file_size > MAX_FILE_SIZE:
+        console.print(
+            f"[yellow]GIF is {format_size(file_size)} "
+            f"(over 10MB limit). Applying lossy compression...[/yellow]"
         )
+        lossy_size = compress_gif(output_path, lossy=20)
+        if lossy_size is not None:
+            file_size = lossy_size
+            console.print(f"[dim]After lossy compression: {format_size(file_size)}[/dim]")
 
-        os.replace(optimized_path, gif_path)
-        return os.path.getsize(gif_path)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        if os.path.exists(optimized_path):
-            os.remove(optimized_path)
-        return None
+        if file_size > MAX_FILE_SIZE:
+            console.print(
+                "[red]Warning: GIF still exceeds 10MB. "
+                "Try --frames 20 or --strength 0.25[/red]"
+            )
+
+    return file_size
 
 
 def format_size(size_bytes: int) -> str:
@@ -232,7 +497,7 @@ def main():
         "--force",
         "-f",
         action="store_true",
-        help="Regenerate even if GIF already exists",
+        help="Regenerate even if the output already exists",
     )
     parser.add_argument(
         "--seed",
@@ -272,11 +537,59 @@ def main():
         default=str(ANIMATE_OUTPUT),
         help=f"Output GIF path (default: {ANIMATE_OUTPUT})",
     )
+    parser.add_argument(
+        "--format",
+        choices=["gif", "webp"],
+        default="gif",
+        help="Output format; webp is full-color and much smaller (default: gif)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile UNet/VAE with torch.compile (CUDA/CPU only, slow first run)",
+    )
+    parser.add_argument(
+        "--fast-vae",
+        action="store_true",
+        help=f"Use tiny VAE ({ANIMATE_TINY_VAE}) for much faster encode/decode",
+    )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Quantize UNet weights to int8 with torchao (CUDA only)",
+    )
+    parser.add_argument(
+        "--no-cfg",
+        action="store_true",
+        help="Disable classifier-free guidance (one UNet pass per step, ~2x faster)",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help=(
+            f"Few-step sampling with LCM-LoRA ({ANIMATE_FAST_NUM_STEPS} steps "
+            f"instead of {ANIMATE_NUM_STEPS}), slightly softer detail"
+        ),
+    )
+    parser.add_argument(
+        "--internal-size",
+        type=int,
+        default=None,
+        help=(
+            f"Generate at this width (height keeps aspect ratio), then upscale "
+            f"to {ANIMATE_WIDTH}x{ANIMATE_HEIGHT} (default: generate at full size)"
+        ),
+    )
     args = parser.parse_args()
 
+    if args.format == "webp":
+        root, ext = os.path.splitext(args.output)
+        if ext.lower() == ".gif":
+            args.output = root + ".webp"
+
     # Check if output already exists
     if os.path.exists(args.output) and not args.force:
-        console.print(f"[green]Animated GIF already exists: {args.output}[/green]")
+        console.print(f"[green]Animation already exists: {args.output}[/green]")
         console.print("Use --force to regenerate.")
         return
 
@@ -288,24 +601,54 @@ def main():
     console.print("[bold magenta]Sakura Animation Generator[/bold magenta]")
     console.print(f"Source: {args.image}")
     console.print(f"Output: {args.output}")
+    # Denoising cost grows with pixel count, so optionally work smaller and upscale
+    gen_width, gen_height = ANIMATE_WIDTH, ANIMATE_HEIGHT
+    if args.internal_size and args.internal_size < ANIMATE_WIDTH:
+        # SD latents are 1/8 resolution, so keep both sides multiples of 8
+        gen_width = args.internal_size // 8 * 8
+        gen_height = round(ANIMATE_HEIGHT * gen_width / ANIMATE_WIDTH / 8) * 8
+
     console.print(
         f"Settings: {args.frames} frames, {ANIMATE_WIDTH}x{ANIMATE_HEIGHT}, "
         f"strength={args.strength}, seed={args.seed}"
     )
+    if (gen_width, gen_height) != (ANIMATE_WIDTH, ANIMATE_HEIGHT):
+        console.print(f"[dim]Generating at {gen_width}x{gen_height}, then upscaling[/dim]")
     console.print()
 
+    import torch
+    from diffusers.utils import load_image
+    from PIL import Image
+
     # Determine device
-    device = IMAGE_DEVICE if torch.backends.mps.is_available() else "cpu"
+    if torch.cuda.is_available():
+        device = "cuda"
+    elif torch.backends.mps.is_available():
+        device = IMAGE_DEVICE
+    else:
+        device = "cpu"
     console.print(f"[dim]Using device: {device}[/dim]")
 
     # Load source image
     console.print("[dim]Loading source image...[/dim]")
-    source = load_image(args.image).resize(
-        (ANIMATE_WIDTH, ANIMATE_HEIGHT), Image.LANCZOS
-    )
+    source = load_image(args.image).resize((gen_width, gen_height), Image.LANCZOS)
 
     # Load pipeline
-    pipe = load_pipeline(device)
+    pipe = load_pipeline(
+        device,
+        use_compile=args.compile,
+        fast_vae=args.fast_vae,
+        quantize=args.quantize,
+        fast=args.fast,
+    )
+
+    num_steps = ANIMATE_FAST_NUM_STEPS if args.fast else ANIMATE_NUM_STEPS
+    if args.no_cfg:
+        guidance_scale = 1.0
+    elif args.fast:
+        guidance_scale = ANIMATE_FAST_GUIDANCE_SCALE
+    else:
+        guidance_scale = ANIMATE_GUIDANCE_SCALE
 
     # Generate frames
     console.print()
@@ -322,6 +665,8 @@ def main():
             num_frames=args.frames,
             strength=args.strength,
             seed=args.seed,
+            num_steps=num_steps,
+            guidance_scale=guidance_scale,
         )
         progress.update(task, completed=True)
 
@@ -331,40 +676,27 @@ def main():
     del pipe
     torch.mps.empty_cache() if device == "mps" else None
 
-    # Save GIF
-    console.print("[dim]Saving GIF...[/dim]")
-    pingpong_count = len(frames) + max(0, len(frames) - 2)
-    file_size = save_gif(frames, args.output, fps=args.fps)
-    console.print(
-        f"[dim]Raw GIF: {format_size(file_size)} "
-        f"({pingpong_count} frames, {args.fps} FPS)[/dim]"
-    )
-
-    # Optimize if possible
-    optimized_size = optimize_gif(args.output)
-    if optimized_size is not None and optimized_size != file_size:
-        console.print(
-            f"[dim]Optimized: {format_size(file_size)} → "
-            f"{format_size(optimized_size)}[/dim]"
-        )
-        file_size = optimized_size
+    if (gen_width, gen_height) != (ANIMATE_WIDTH, ANIMATE_HEIGHT):
+        frames = [
+            frame.resize((ANIMATE_WIDTH, ANIMATE_HEIGHT), Image.LANCZOS)
+            for frame in frames
+        ]
 
-    # Check against GitHub limit
-    if file_size > MAX_GIF_SIZE:
+    pingpong_count = len(frames) + max(0, len(frames) - 2)
+    if args.format == "webp":
+        console.print("[dim]Saving WebP...[/dim]")
+        file_size = save_webp(frames, args.output, fps=args.fps)
         console.print(
-            f"[yellow]GIF is {format_size(file_size)} "
-            f"(over 10MB limit). Applying lossy compression...[/yellow]"
+            f"[dim]WebP: {format_size(file_size)} "
+            f"({pingpong_count} frames, {args.fps} FPS)[/dim]"
         )
-        lossy_size = lossy_compress_gif(args.output, lossy=20)
-        if lossy_size is not None:
-            file_size = lossy_size
-            console.print(f"[dim]After lossy compression: {format_size(file_size)}[/dim]")
-
-        if file_size > MAX_GIF_SIZE:
+        if file_size > MAX_FILE_SIZE:
             console.print(
-                "[red]Warning: GIF still exceeds 10MB. "
+                f"[red]Warning: WebP is {format_size(file_size)} (over 10MB limit). "
                 "Try --frames 20 or --strength 0.25[/red]"
             )
+    else:
+        file_size = write_gif(frames, args.output, fps=args.fps)
 
     console.print()
     console.print("[bold green]Animation complete![/bold green]")
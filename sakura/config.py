@@ -2,6 +2,7 @@
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -14,11 +15,14 @@ SESSIONS_DIR = HISTORY_DIR / "sessions"
 # Ollama settings
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = "dolphin-mistral"
+OLLAMA_KEEP_ALIVE = "30m"  # Keep model loaded between turns (Ollama default is 5m)
 
 # TTS settings
 TTS_VOICE = "ja-JP-NanamiNeural"
 TTS_PITCH = "+25Hz"
 TTS_RATE = "+5%"
+TTS_CACHE_DIR = CACHE_DIR / "tts"  # Rendered mp3s keyed by voice settings + text
+TTS_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Oldest-used files evicted beyond this
 
 # Voice input settings
 WHISPER_MODEL = "small"
@@ -31,18 +35,24 @@ MAX_RECORDING_S = 30.0
 # Image generation settings (local with diffusers)
 IMAGE_MODEL = "cagliostrolab/animagine-xl-4.0"
 IMAGE_DEVICE = "mps"  # Apple Silicon
+IMAGE_COMPILE_CACHE = PROJECT_ROOT / ".cache" / "torchinductor"  # setup/animate --compile artifacts
+IMAGE_VAE_FP16 = "madebyollin/sdxl-vae-fp16-fix"  # SDXL VAE that doesn't NaN in fp16
 
 # Animation settings (AnimateDiff via diffusers)
 # Tuned to maximize quality while keeping output GIF under 10MB (GitHub limit)
 ANIMATE_BASE_MODEL = "gsdf/Counterfeit-V3.0"          # SD 1.5 anime model
 ANIMATE_MOTION_ADAPTER = "guoyww/animatediff-motion-adapter-v1-5-3"
 ANIMATE_VAE = "stabilityai/sd-vae-ft-mse"
+ANIMATE_TINY_VAE = "madebyollin/taesd"      # Distilled SD 1.5 VAE for --fast-vae
 ANIMATE_NUM_FRAMES = 24         # More frames = smoother animation
 ANIMATE_WIDTH = 768              # Higher res (max practical for SD 1.5)
 ANIMATE_HEIGHT = 768
 ANIMATE_STRENGTH = 0.35         # Low = subtle motion, preserves original look
 ANIMATE_GUIDANCE_SCALE = 7.5
 ANIMATE_NUM_STEPS = 25          # More steps = better quality
+ANIMATE_LCM_LORA = "latent-consistency/lcm-lora-sdv1-5"  # --fast: few-step sampling
+ANIMATE_FAST_NUM_STEPS = 6
+ANIMATE_FAST_GUIDANCE_SCALE = 1.5  # LCM needs low guidance; 7.5 burns the image
 ANIMATE_FPS = 12                # Smoother playback
 ANIMATE_SEED = 42
 ANIMATE_OUTPUT = ASSETS_DIR / "sakura-animated.gif"
@@ -74,15 +84,16 @@ except ImportError:
     NSFW_CHARACTER_PROMPT = ""
     NSFW_NEGATIVE_PROMPT = ""
 
-# Valid emotions
-EMOTIONS = [
+# Valid emotions (ordered list for iteration/CLI choices, frozenset for membership)
+EMOTIONS_LIST = [
     "happy", "sad", "angry", "surprised", "shy",
     "thinking", "excited", "tired", "confused", "neutral",
     "love", "worried", "proud", "playful"
 ]
+EMOTIONS = frozenset(EMOTIONS_LIST)
 
-# Map similar/alternate emotions to valid ones
-EMOTION_ALIASES = {
+# Map similar/alternate emotions to valid ones (read-only)
+EMOTION_ALIASES = MappingProxyType({
     "shocked": "surprised",
     "depressed": "sad",
     "anxious": "worried",
@@ -108,7 +119,13 @@ EMOTION_ALIASES = {
     "softening": "happy",
     "overjoyed": "excited",
     "tsundere": "neutral",
-}
+})
+
+# Lowercased emotion or alias -> valid emotion (alias resolution + validation in one lookup)
+CANONICAL_EMOTION = {emotion: emotion for emotion in EMOTIONS_LIST}
+CANONICAL_EMOTION.update(
+    (alias, emotion) for alias, emotion in EMOTION_ALIASES.items() if emotion in EMOTIONS
+)
 
 # Character image base prompt
 CHARACTER_BASE_PROMPT = (
@@ -139,6 +156,7 @@ EMOTION_PROMPTS = {
 MAX_RECENT_MESSAGES = 50      # Keep full detail for last N messages
 MAX_SESSIONS_TO_LOAD = 3      # Load N most recent session files
 MAX_SUMMARY_WORDS = 2000      # Compress summary if it exceeds this
+MAX_SUMMARIZE_CHARS = 20000   # Cap on message text sent for summarization (newest kept)
 
 # Summarization prompt for Ollama
 SUMMARIZATION_PROMPT = """You are summarizing a conversation between Sakura (a tsundere maid AI) and her Goshujin-sama (master).
@@ -199,7 +217,7 @@ Generate greeting:"""
 
 # Random greetings with emotions (fallback when no memory exists)
 # Format: (japanese, english, emotion)
-GREETINGS = [
+GREETINGS = (
     (
         "ふん、やっと来たわね、ご主人様。待ってたのよ…べ、別に心配してたわけじゃないんだから！",
         "Hmph, you're finally here, Goshujin-sama. I've been waiting... N-not that I was worried or anything!",
@@ -225,7 +243,7 @@ GREETINGS = [
         "Welcome back, Goshujin-sama. I hope you don't expect me to be happy to see you... because I'm not!",
         "playful",
     ),
-]
+)
 
 # System prompt for Sakura
 SYSTEM_PROMPT = """You are Sakura, a tsundere Japanese maid. You address your user as "ご主人様" (Goshujin-sama/master).
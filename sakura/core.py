@@ -1,37 +1,60 @@
 """Main conversation loop for Sakura."""
 
-from datetime import datetime
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from .ai import generate_greeting, generate_response
 from .config import MAX_RECENT_MESSAGES
-from .memory import generate_session_id, load_memory, load_summary, save_session, summarize_if_needed
-from .speech import init as init_speech
-from .tts import speak_bilingual, stop_speaking
+from .memory import (
+    flush_saves,
+    generate_session_id,
+    load_memory,
+    load_summary,
+    save_session,
+    save_session_async,
+    summarize_if_needed,
+)
 from .ui import (
     display_bilingual_message,
     display_status,
     display_welcome,
     get_input_with_voice,
+    preview_emotion,
 )
 
 
 def run() -> None:
     """Run the main conversation loop."""
+    # Show welcome banner first; the heavy modules below (ollama, torch via
+    # speech, edge-tts) are imported lazily so it appears immediately
+    display_welcome()
+
+    from .ai import generate_greeting, generate_response, warmup
+
+    # Start loading the LLM right away so it's resident by the time we need it
+    threading.Thread(target=warmup, daemon=True).start()
+
     # Generate session ID and load memory
     session_id = generate_session_id()
     summary_data, recent_messages = load_memory()
     session_messages: list[dict] = []  # Current session only (this gets saved)
 
-    # Show welcome banner
-    display_welcome()
+    # Generate context-aware greeting (or random if no memory) in the background
+    # while voice models load - both are slow and independent of each other
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        greeting = executor.submit(generate_greeting, summary_data, recent_messages)
+
+        # Initialize voice input
+        display_status("Loading voice models...")
+        from .speech import init as init_speech
+        from .tts import speak_bilingual, stop_speaking
+
+        init_speech()
 
-    # Initialize voice input
-    display_status("Loading voice models...")
-    init_speech()
+        display_status("Preparing greeting...")
+        jp_greeting, en_greeting, emotion = greeting.result()
 
-    # Generate context-aware greeting (or random if no memory)
-    display_status("Preparing greeting...")
-    jp_greeting, en_greeting, emotion = generate_greeting(summary_data, recent_messages)
     display_bilingual_message(emotion, jp_greeting, en_greeting)
     if warning := speak_bilingual(jp_greeting, en_greeting):
         display_status(warning)
@@ -49,16 +72,19 @@ def run() -> None:
             if not user_input:
                 continue
 
-            # Add user message to session history with timestamp
+            # Add user message to session history with timestamp (epoch ns)
             session_messages.append({
                 "role": "user",
                 "content": user_input,
-                "timestamp": datetime.now().isoformat(),
+                "ts": time.time_ns(),
             })
 
-            # Generate response (combine recent + session messages for context)
-            all_messages = recent_messages + session_messages
-            japanese, english, emotion = generate_response(all_messages, summary_data)
+            # Generate response (recent + session messages as context, without copying)
+            japanese, english, emotion = generate_response(
+                itertools.chain(recent_messages, session_messages),
+                summary_data,
+                on_emotion=preview_emotion,
+            )
 
             # Store full bilingual format so model learns the pattern
             bilingual_content = f"{japanese}\n---\n{english}" if japanese else english
@@ -66,7 +92,7 @@ def run() -> None:
                 "role": "assistant",
                 "content": bilingual_content,
                 "emotion": emotion,
-                "timestamp": datetime.now().isoformat(),
+                "ts": time.time_ns(),
             })
 
             # Display bilingual response
@@ -74,9 +100,9 @@ def run() -> None:
             if warning := speak_bilingual(japanese, english):
                 display_status(warning)
 
-            # Auto-save every 10 messages for crash safety
+            # Auto-save every 10 messages for crash safety (off the reply path)
             if len(session_messages) % 10 == 0:
-                save_session(session_id, session_messages)
+                save_session_async(session_id, session_messages)
 
             # Check if total context exceeds limit
             total_context = len(recent_messages) + len(session_messages)
@@ -87,6 +113,7 @@ def run() -> None:
 
     except KeyboardInterrupt:
         print()  # New line after ^C
+        flush_saves()  # Let a pending autosave finish before the final write
         # Only save if we have messages (skip empty sessions)
         if session_messages:
             display_status("Saving conversation...")
@@ -1,11 +1,17 @@
 """Emotion image display for Sakura using iTerm2 inline images."""
 
-import base64
+import functools
 import logging
 import os
 import sys
 from pathlib import Path
 
+try:
+    # SIMD (SSSE3/AVX2) codec with the stdlib base64 API
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 from .config import CACHE_DIR, NSFW_CACHE_DIR, NSFW_MODE, EMOTIONS
 
 logger = logging.getLogger(__name__)
@@ -47,32 +53,39 @@ def get_image_path(emotion: str) -> Path | None:
         return image_path
 
 
-def _iterm2_display(image_path: Path, width: int = DISPLAY_WIDTH) -> None:
-    """Display image using iTerm2 escape sequence.
+@functools.lru_cache(maxsize=32)
+def _escape_sequence(image_path: Path, width: int) -> str:
+    """Build the iTerm2 inline-image escape sequence for an image.
 
     iTerm2 inline image protocol:
     ESC ] 1337 ; File = [args] : base64_data BEL
 
-    Args:
-        image_path: Path to the image file
-        width: Display width in character cells
+    Cached: each emotion image is read and base64-encoded once per process.
     """
     # Read and encode image
     with open(image_path, "rb") as f:
         image_data = f.read()
     encoded = base64.b64encode(image_data).decode("ascii")
 
-    # Build escape sequence
     # inline=1 displays the image (vs downloading)
     # width specifies character cell width
-    escape_seq = f"\033]1337;File=inline=1;width={width}:{encoded}\a"
+    return f"\033]1337;File=inline=1;width={width}:{encoded}\a\n"
+
+
+def _iterm2_display(image_path: Path, width: int = DISPLAY_WIDTH) -> None:
+    """Display image using iTerm2 escape sequence.
+
+    Args:
+        image_path: Path to the image file
+        width: Display width in character cells
+    """
+    escape_seq = _escape_sequence(image_path, width)
 
     # Flush pending output (Rich console) before writing image
     sys.stdout.flush()
 
-    # Write escape sequence and newline
+    # Write escape sequence (includes trailing newline)
     sys.stdout.write(escape_seq)
-    sys.stdout.write("\n")
     sys.stdout.flush()
 
 
@@ -1,18 +1,27 @@
 """Memory persistence for Sakura - session saving and summarization."""
 
-import json
+import heapq
+import itertools
 import logging
+import os
+import queue
+import sys
+import threading
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 
-import ollama
+import orjson
 
 from .config import (
     HISTORY_DIR,
     SESSIONS_DIR,
     OLLAMA_MODEL,
+    OLLAMA_KEEP_ALIVE,
     MAX_RECENT_MESSAGES,
     MAX_SESSIONS_TO_LOAD,
     MAX_SUMMARY_WORDS,
+    MAX_SUMMARIZE_CHARS,
     SUMMARIZATION_PROMPT,
 )
 
@@ -20,6 +29,22 @@ logger = logging.getLogger(__name__)
 
 SUMMARY_FILE = HISTORY_DIR / "summary.json"
 
+# SUMMARIZATION_PROMPT pre-split around its two placeholders (formatting with
+# sentinels first resolves the {{ }} escapes), so building it is a plain concat
+_SUMMARY_HEAD, _SUMMARY_MIDDLE, _SUMMARY_TAIL = SUMMARIZATION_PROMPT.format(
+    existing_summary_section="\0", messages_text="\0"
+).split("\0")
+
+# Background autosave: (session_id, messages snapshot) jobs for one daemon thread
+_save_queue: queue.Queue[tuple[str, list[dict]]] = queue.Queue()
+_save_thread: threading.Thread | None = None
+
+# session_id -> number of messages already appended to its .jsonl file
+_saved_counts: dict[str, int] = {}
+
+# (mtime_ns, parsed summary) of the last summary.json read
+_summary_cache: tuple[int, dict | None] = (-1, None)
+
 
 def generate_session_id() -> str:
     """Generate a session ID from current timestamp."""
@@ -27,28 +52,122 @@ def generate_session_id() -> str:
 
 
 def save_session(session_id: str, messages: list[dict]) -> None:
-    """Save current session to disk."""
+    """Save current session to disk.
+
+    Sessions are JSON Lines: a header line, then one line per message. Only
+    messages added since the last save are appended, so long sessions don't
+    rewrite the whole history every time.
+    """
     try:
         SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Parse session_id to get correct started_at timestamp
-        dt = datetime.strptime(session_id, "%Y-%m-%d_%H-%M-%S")
+        file_path = SESSIONS_DIR / f"session_{session_id}.jsonl"
+        saved = _saved_counts.get(session_id, 0)
+        lines = [orjson.dumps(msg) + b"\n" for msg in messages[saved:]]
 
-        session_data = {
-            "session_id": session_id,
-            "started_at": dt.isoformat(),
-            "messages": messages,
-        }
+        if saved == 0 and not file_path.exists():
+            # Parse session_id to get correct started_at timestamp
+            dt = datetime.strptime(session_id, "%Y-%m-%d_%H-%M-%S")
+            header = {"session_id": session_id, "started_at": dt.isoformat()}
+            lines.insert(0, orjson.dumps(header) + b"\n")
 
-        file_path = SESSIONS_DIR / f"session_{session_id}.json"
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, ensure_ascii=False, indent=2)
+        if lines:
+            with open(file_path, "ab") as f:
+                f.write(b"".join(lines))
+        _saved_counts[session_id] = len(messages)
 
         logger.debug(f"Session saved: {file_path}")
     except Exception as e:
         logger.warning(f"Failed to save session: {e}")
 
 
+def _save_worker() -> None:
+    """Drain queued autosaves one at a time (save_session never raises)."""
+    while True:
+        session_id, messages = _save_queue.get()
+        try:
+            save_session(session_id, messages)
+        finally:
+            _save_queue.task_done()
+
+
+def save_session_async(session_id: str, messages: list[dict]) -> None:
+    """Queue a session save on a background thread and return immediately.
+
+    The message list is snapshotted, so the caller can keep appending to it.
+    """
+    global _save_thread
+    if _save_thread is None:
+        _save_thread = threading.Thread(target=_save_worker, daemon=True)
+        _save_thread.start()
+    _save_queue.put((session_id, list(messages)))
+
+
+def flush_saves() -> None:
+    """Block until all queued autosaves have been written."""
+    _save_queue.join()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write JSON atomically (tmp file + rename) so a crash never truncates it."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, path)
+
+
+def _session_entries() -> list[os.DirEntry]:
+    """List session files with a single scandir pass (DirEntry caches its stat).
+
+    A missing sessions directory is just an empty list, so callers don't need
+    a separate exists() check.
+    """
+    try:
+        with os.scandir(SESSIONS_DIR) as it:
+            return [
+                entry for entry in it
+                if entry.name.startswith("session_")
+                and entry.name.endswith((".jsonl", ".json"))
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _newest_sessions(entries: list[os.DirEntry], n: int) -> list[os.DirEntry]:
+    """Return the n most recently modified entries, newest first."""
+    return heapq.nlargest(n, entries, key=lambda entry: entry.stat().st_mtime_ns)
+
+
+def _intern_fields(message: dict) -> dict:
+    """Intern the small repeated values so loaded messages share one copy each."""
+    message["role"] = sys.intern(message["role"])
+    if isinstance(message.get("emotion"), str):
+        message["emotion"] = sys.intern(message["emotion"])
+    return message
+
+
+def _load_session(path: str) -> list[dict]:
+    """Parse a session file into its messages.
+
+    Legacy single-document .json sessions are still supported.
+    """
+    with open(path, "rb") as f:
+        if path.endswith(".json"):
+            return [_intern_fields(msg) for msg in orjson.loads(f.read()).get("messages", [])]
+
+        messages = []
+        for line in f:
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # Torn final line from a crash mid-append
+                logger.warning(f"Skipping unreadable line in {path}")
+                continue
+            if "role" in record:  # Skip the header line
+                messages.append(_intern_fields(record))
+        return messages
+
+
 def load_memory() -> tuple[dict | None, list[dict]]:
     """Load summary and recent messages from disk.
 
@@ -58,48 +177,36 @@ def load_memory() -> tuple[dict | None, list[dict]]:
         - recent_messages: Messages from recent sessions
     """
     summary_data = _load_summary()
-    recent_messages = []
+    loaded: list[list[dict]] = []  # Per-session message lists, newest session first
+    loaded_count = 0
 
     try:
-        if not SESSIONS_DIR.exists():
-            return summary_data, recent_messages
-
-        # Get session files sorted by mtime (newest first)
-        session_files = sorted(
-            SESSIONS_DIR.glob("session_*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        # Only the newest few sessions can be loaded, so skip the full sort
+        session_entries = _newest_sessions(_session_entries(), MAX_SESSIONS_TO_LOAD)
 
-        # Load sessions until we have ~50 messages or hit limit
-        sessions_loaded = 0
-        for session_file in session_files:
-            if sessions_loaded >= MAX_SESSIONS_TO_LOAD:
-                break
-            if len(recent_messages) >= MAX_RECENT_MESSAGES:
+        # Load sessions (newest first) until we have ~50 messages
+        for entry in session_entries:
+            if loaded_count >= MAX_RECENT_MESSAGES:
                 break
 
             try:
-                with open(session_file, "r", encoding="utf-8") as f:
-                    session_data = json.load(f)
-
-                messages = session_data.get("messages", [])
-                # Prepend older messages (so newest are at end)
-                recent_messages = messages + recent_messages
-                sessions_loaded += 1
-                logger.debug(f"Loaded session: {session_file.name}")
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Skipping corrupted session file {session_file}: {e}")
+                messages = _load_session(entry.path)
+                loaded.append(messages)
+                loaded_count += len(messages)
+                logger.debug(f"Loaded session: {entry.name}")
+            except (orjson.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Skipping corrupted session file {entry.path}: {e}")
                 continue
 
-        # Trim to max if we loaded too many
-        if len(recent_messages) > MAX_RECENT_MESSAGES:
-            recent_messages = recent_messages[-MAX_RECENT_MESSAGES:]
-
     except Exception as e:
         logger.warning(f"Failed to load memory: {e}")
 
-    return summary_data, recent_messages
+    # Oldest session first, so newest messages end up last; the bounded deque
+    # drops the overflow as it goes instead of prepending and slicing lists
+    recent_messages = deque(
+        itertools.chain.from_iterable(reversed(loaded)), maxlen=MAX_RECENT_MESSAGES
+    )
+    return summary_data, list(recent_messages)
 
 
 def summarize_if_needed(
@@ -151,14 +258,29 @@ def summarize_if_needed(
 
 
 def load_summary() -> dict | None:
-    """Load summary.json if it exists."""
+    """Load summary.json if it exists.
+
+    The parsed result is reused until the file's mtime changes (e.g. after
+    _save_summary), so treat the returned dict as read-only.
+    """
+    global _summary_cache
     try:
-        if SUMMARY_FILE.exists():
-            with open(SUMMARY_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+        mtime_ns = SUMMARY_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if mtime_ns == _summary_cache[0]:
+        return _summary_cache[1]
+
+    try:
+        with open(SUMMARY_FILE, "rb") as f:
+            summary = orjson.loads(f.read())
     except Exception as e:
         logger.warning(f"Failed to load summary: {e}")
-    return None
+        return None
+
+    _summary_cache = (mtime_ns, summary)
+    return summary
 
 
 # Alias for internal use
@@ -167,10 +289,12 @@ _load_summary = load_summary
 
 def _save_summary(summary_data: dict) -> None:
     """Save summary.json."""
+    global _summary_cache
     try:
         HISTORY_DIR.mkdir(parents=True, exist_ok=True)
-        with open(SUMMARY_FILE, "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, ensure_ascii=False, indent=2)
+        _write_json(SUMMARY_FILE, summary_data)
+        # Seed the cache directly; a same-tick rewrite could share the old mtime
+        _summary_cache = (SUMMARY_FILE.stat().st_mtime_ns, summary_data)
         logger.debug("Summary saved")
     except Exception as e:
         logger.error(f"Failed to save summary: {e}")
@@ -180,60 +304,76 @@ def _save_summary(summary_data: dict) -> None:
 def _delete_old_sessions(keep_recent: int = 1) -> None:
     """Delete old session files, keeping only the N most recent."""
     try:
-        if not SESSIONS_DIR.exists():
-            return
-
-        # Get files sorted by mtime (newest first)
-        session_files = sorted(
-            SESSIONS_DIR.glob("session_*.json"),
-            key=lambda f: f.stat().st_mtime,
-            reverse=True
-        )
+        session_entries = _session_entries()
+        keep = {entry.path for entry in _newest_sessions(session_entries, keep_recent)}
 
         # Delete all but the most recent N
-        for session_file in session_files[keep_recent:]:
-            session_file.unlink()
-            logger.debug(f"Deleted old session: {session_file.name}")
+        for entry in session_entries:
+            if entry.path not in keep:
+                os.remove(entry.path)
+                logger.debug(f"Deleted old session: {entry.name}")
 
     except Exception as e:
         logger.warning(f"Failed to delete old sessions: {e}")
 
 
+def _trim_for_summary(messages: list[dict]) -> list[dict]:
+    """Keep the newest messages whose content fits in MAX_SUMMARIZE_CHARS.
+
+    The newest message is always kept, even if it alone exceeds the cap.
+    """
+    total = 0
+    start = len(messages)
+    while start > 0:
+        total += len(messages[start - 1]["content"])
+        if total > MAX_SUMMARIZE_CHARS and start < len(messages):
+            break
+        start -= 1
+
+    if start:
+        logger.info(f"Summarization input capped: dropped {start} oldest messages")
+    return messages[start:]
+
+
 def _summarize_messages(messages: list[dict], existing_summary: dict | None) -> dict:
     """Call Ollama to summarize messages."""
+    messages = _trim_for_summary(messages)
+
     # Build existing summary context
-    existing_context = ""
+    context_parts = []
     if existing_summary:
-        existing_context = f"\n\nExisting summary to update:\n{existing_summary.get('summary', '')}"
+        context_parts.append(f"\n\nExisting summary to update:\n{existing_summary.get('summary', '')}")
         if existing_summary.get('key_facts'):
-            existing_context += f"\n\nExisting key facts:\n"
-            existing_context += "\n".join(f"- {fact}" for fact in existing_summary['key_facts'])
+            context_parts.append("\n\nExisting key facts:\n")
+            context_parts.append("\n".join(f"- {fact}" for fact in existing_summary['key_facts']))
 
         # Check if compression needed
         word_count = len(existing_summary.get('summary', '').split())
         if word_count > MAX_SUMMARY_WORDS:
-            existing_context += (
+            context_parts.append(
                 f"\n\nIMPORTANT: The existing summary is {word_count} words, which exceeds the limit. "
                 f"Please compress the combined summary to under {MAX_SUMMARY_WORDS} words "
                 "while preserving the most important information and key facts."
             )
+    existing_context = "".join(context_parts)
 
-    # Format messages for the prompt
-    messages_text = ""
-    for msg in messages:
-        role = "Goshujin-sama" if msg["role"] == "user" else "Sakura"
-        messages_text += f"{role}: {msg['content']}\n"
+    # Format messages for the prompt (one join instead of repeated +=)
+    messages_text = "".join(
+        f"{'Goshujin-sama' if msg['role'] == 'user' else 'Sakura'}: {msg['content']}\n"
+        for msg in messages
+    )
 
     # Build full prompt
-    prompt = SUMMARIZATION_PROMPT.format(
-        existing_summary_section=existing_context,
-        messages_text=messages_text
-    )
+    prompt = _SUMMARY_HEAD + existing_context + _SUMMARY_MIDDLE + messages_text + _SUMMARY_TAIL
+
+    # Deferred: only needed when summarizing, keeps `import sakura.memory` light
+    import ollama
 
     try:
         response = ollama.chat(
             model=OLLAMA_MODEL,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            keep_alive=OLLAMA_KEEP_ALIVE,
         )
         raw_response = response['message']['content']
 
@@ -243,13 +383,13 @@ def _summarize_messages(messages: list[dict], existing_summary: dict | None) ->
             end = raw_response.rfind('}') + 1
             if start >= 0 and end > start:
                 json_str = raw_response[start:end]
-                result = json.loads(json_str)
+                result = orjson.loads(json_str)
                 return {
                     "summary": result.get("summary", raw_response),
                     "key_facts": result.get("key_facts", []),
                     "last_summarized": datetime.now().isoformat(),
                 }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # Fallback: use raw response as summary
@@ -1,24 +1,40 @@
 """One-time setup script to generate emotion images for Sakura."""
 
 import argparse
+import gc
+import importlib.util
 import logging
 import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Parallel Rust downloader for the multi-GB model weights, if installed.
+# huggingface_hub reads this at import time, so it must be set first.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 import torch
-from diffusers import StableDiffusionXLPipeline, StableDiffusionXLImg2ImgPipeline, EulerDiscreteScheduler
-from huggingface_hub import snapshot_download
+from diffusers import (
+    AutoencoderKL,
+    EulerDiscreteScheduler,
+    StableDiffusionXLImg2ImgPipeline,
+    StableDiffusionXLPipeline,
+)
+from huggingface_hub import snapshot_download, try_to_load_from_cache
 from PIL import Image
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 from .config import (
     CACHE_DIR,
-    EMOTIONS,
+    EMOTIONS_LIST,
     CHARACTER_BASE_PROMPT,
     EMOTION_PROMPTS,
     IMAGE_MODEL,
     IMAGE_DEVICE,
+    IMAGE_COMPILE_CACHE,
+    IMAGE_VAE_FP16,
     # NSFW settings
     NSFW_AVAILABLE,
     NSFW_CACHE_DIR,
@@ -39,6 +55,21 @@ GUIDANCE_SCALE = 5
 NUM_INFERENCE_STEPS = 28
 IMG2IMG_STRENGTH = 0.75
 
+# Below this much GPU working set, also slice attention (trades speed for memory)
+LOW_MEMORY_BYTES = 16 * 1024**3
+
+# Free cached MPS memory before a generation once allocations pass this fraction
+MPS_HIGH_WATER = 0.8
+
+# PNG zlib level for generated assets (default 6 is ~5x slower to encode)
+PNG_COMPRESS_LEVEL = 1
+
+# VAE tile size in pixels; the SDXL default (1024) never tiles at our sizes
+VAE_TILE_SIZE = 512
+
+# DeepCache: run the full UNet every Nth step, reuse cached deep features between
+DEEPCACHE_INTERVAL = 3
+
 # Quality tags for Animagine XL 4.0
 QUALITY_TAGS = "masterpiece, high score, great score, absurdres"
 
@@ -50,24 +81,35 @@ NEGATIVE_PROMPT = (
 )
 
 
+# Full prompts per emotion, built once (all inputs are constants)
+_SFW_PROMPTS = {
+    emotion: f"{CHARACTER_BASE_PROMPT}, {QUALITY_TAGS}, {EMOTION_PROMPTS.get(emotion, '')}"
+    for emotion in EMOTIONS_LIST
+}
+_NSFW_PROMPTS = {
+    emotion: f"{NSFW_CHARACTER_PROMPT}, {NSFW_EMOTION_PROMPTS.get(emotion, '')}"
+    for emotion in EMOTIONS_LIST
+}
+
+
 def get_full_prompt(emotion: str) -> str:
     """Build full prompt with character base + quality tags + emotion."""
-    emotion_addition = EMOTION_PROMPTS.get(emotion, "")
-    return f"{CHARACTER_BASE_PROMPT}, {QUALITY_TAGS}, {emotion_addition}"
+    return _SFW_PROMPTS.get(emotion, f"{CHARACTER_BASE_PROMPT}, {QUALITY_TAGS}, ")
 
 
 def get_nsfw_prompt(emotion: str) -> str:
     """Build NSFW prompt with character base + emotion (NoobAI format)."""
-    emotion_addition = NSFW_EMOTION_PROMPTS.get(emotion, "")
-    return f"{NSFW_CHARACTER_PROMPT}, {emotion_addition}"
+    return _NSFW_PROMPTS.get(emotion, f"{NSFW_CHARACTER_PROMPT}, ")
 
 
 def ensure_model_downloaded(model_id: str, is_nsfw: bool = False) -> None:
-    """Check if model is cached, download if not."""
-    cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-    model_folder = f"models--{model_id.replace('/', '--')}"
+    """Check if model is cached, download if not.
 
-    if not os.path.exists(os.path.join(cache_dir, model_folder)):
+    Looks in the configured Hugging Face cache (HF_HUB_CACHE / HF_HOME),
+    keyed on model_index.json so an empty or aborted model folder still
+    triggers a download.
+    """
+    if not isinstance(try_to_load_from_cache(model_id, "model_index.json"), str):
         if is_nsfw:
             console.print("[bold yellow]NSFW Mode: Generating images[/bold yellow]")
             console.print("[dim]These images are for personal use only.[/dim]")
@@ -78,20 +120,92 @@ def ensure_model_downloaded(model_id: str, is_nsfw: bool = False) -> None:
             console.print(f"[bold]Downloading {model_id}...[/bold]")
             console.print("[dim]This may take 10-20 minutes depending on your connection.[/dim]")
 
-        snapshot_download(repo_id=model_id, repo_type="model")
+        snapshot_download(repo_id=model_id, repo_type="model", max_workers=8)
         console.print("[green]Model downloaded successfully![/green]")
     else:
         console.print(f"[dim]Model {model_id} already cached.[/dim]")
 
 
-def load_nsfw_pipeline() -> StableDiffusionXLPipeline:
-    """Load NoobAI XL with v-prediction scheduler."""
+def vae_kwargs(dtype: torch.dtype) -> dict:
+    """Extra from_pretrained kwargs for the given dtype.
+
+    The stock SDXL VAE overflows in float16 (NaN -> black images), so fp16
+    pipelines get the patched fp16-fix VAE instead of loading the stock one.
+    """
+    if dtype == torch.float32:
+        return {}
+    console.print(f"[dim]Loading fp16-safe VAE: {IMAGE_VAE_FP16}...[/dim]")
+    return {"vae": AutoencoderKL.from_pretrained(IMAGE_VAE_FP16, torch_dtype=dtype)}
+
+
+def enable_memory_savers(pipe: StableDiffusionXLPipeline) -> None:
+    """Apply MPS memory optimizations.
+
+    VAE decode is the peak memory spike, so it is always sliced and tiled.
+    Attention slicing serializes attention, so it is only enabled on Macs
+    with less than LOW_MEMORY_BYTES of recommended GPU working set.
+    """
+    pipe.enable_vae_slicing()
+    pipe.enable_vae_tiling()
+    pipe.vae.tile_sample_min_size = VAE_TILE_SIZE
+    pipe.vae.tile_latent_min_size = VAE_TILE_SIZE // pipe.vae_scale_factor
+
+    if IMAGE_DEVICE != "mps" or torch.mps.recommended_max_memory() < LOW_MEMORY_BYTES:
+        pipe.enable_attention_slicing()
+
+
+def enable_deepcache(pipe: StableDiffusionXLPipeline):
+    """Enable DeepCache step-skipping on the pipeline's UNet.
+
+    Returns the helper (call .disable() before reusing the UNet in another
+    pipeline), or None if DeepCache isn't installed.
+    """
+    try:
+        from DeepCache import DeepCacheSDHelper
+    except ImportError:
+        console.print("[yellow]DeepCache not installed, running the full UNet every step.[/yellow]")
+        return None
+
+    helper = DeepCacheSDHelper(pipe=pipe)
+    helper.set_params(cache_interval=DEEPCACHE_INTERVAL, cache_branch_id=0)
+    helper.enable()
+    return helper
+
+
+def compile_pipeline(pipe: StableDiffusionXLPipeline) -> None:
+    """Compile the UNet and VAE decoder with torch.compile.
+
+    The text encoders are left alone; they run once per prompt, too few
+    times to pay back the compile. Compilation happens on the first call,
+    and Inductor artifacts are cached under IMAGE_COMPILE_CACHE.
+    Unsupported ops fall back to eager.
+    """
+    console.print("[dim]Compiling UNet and VAE with torch.compile...[/dim]")
+
+    # setdefault: an explicit TORCHINDUCTOR_CACHE_DIR from the user still wins
+    os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", str(IMAGE_COMPILE_CACHE))
+    import torch._inductor.config as inductor_config
+
+    inductor_config.fx_graph_cache = True
+
+    # Fall back to eager instead of raising if Dynamo/Inductor can't handle something
+    torch._dynamo.config.suppress_errors = True
+
+    # Shapes are fixed for a whole run, so no dynamic-shape guards
+    pipe.unet = torch.compile(pipe.unet, fullgraph=False, dynamic=False)
+    pipe.vae.decode = torch.compile(pipe.vae.decode, dynamic=False)
+
+
+def load_nsfw_pipeline(fp32: bool = False) -> StableDiffusionXLPipeline:
+    """Load NoobAI XL with v-prediction scheduler (float16 unless fp32)."""
     console.print(f"[dim]Loading {NSFW_IMAGE_MODEL}...[/dim]")
 
+    dtype = torch.float32 if fp32 else torch.float16
     pipe = StableDiffusionXLPipeline.from_pretrained(
         NSFW_IMAGE_MODEL,
-        torch_dtype=torch.float32,
+        torch_dtype=dtype,
         use_safetensors=True,
+        **vae_kwargs(dtype),
     )
 
     # Override scheduler with v-prediction
@@ -101,43 +215,48 @@ def load_nsfw_pipeline() -> StableDiffusionXLPipeline:
     )
 
     pipe.to(IMAGE_DEVICE)
-    pipe.enable_attention_slicing()
-    pipe.enable_vae_slicing()
+    enable_memory_savers(pipe)
 
     console.print("[green]Model loaded successfully.[/green]")
     return pipe
 
 
 def check_image_size(image_path: Path, expected_width: int, expected_height: int | None = None) -> bool:
-    """Check if existing image matches expected size."""
+    """Check if existing image matches expected size.
+
+    Reads width/height straight from the PNG IHDR chunk (first 24 bytes).
+    """
     if expected_height is None:
         expected_height = expected_width
-    if not image_path.exists():
-        return False
     try:
-        with Image.open(image_path) as img:
-            return img.size == (expected_width, expected_height)
-    except Exception:
+        with open(image_path, "rb") as f:
+            header = f.read(24)
+    except OSError:
         return False
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n":
+        return False
+    return struct.unpack(">II", header[16:24]) == (expected_width, expected_height)
+
 
+def load_pipeline(fp32: bool = False) -> StableDiffusionXLPipeline:
+    """Load the txt2img pipeline with MPS optimizations.
 
-def load_pipeline() -> StableDiffusionXLPipeline:
-    """Load the txt2img pipeline with MPS optimizations."""
+    Runs in float16 (half the memory traffic of float32) with the fp16-fix VAE.
+    fp32=True restores the old full-precision path if fp16 misbehaves.
+    """
     console.print(f"[dim]Loading {IMAGE_MODEL}...[/dim]")
     console.print("[dim]First run will download ~7GB model.[/dim]")
 
-    # Use float32 on MPS to avoid NaN issues with float16
+    dtype = torch.float32 if fp32 else torch.float16
     pipe = StableDiffusionXLPipeline.from_pretrained(
         IMAGE_MODEL,
-        torch_dtype=torch.float32,
+        torch_dtype=dtype,
         use_safetensors=True,
         add_watermarker=False,
+        **vae_kwargs(dtype),
     )
     pipe.to(IMAGE_DEVICE)
-
-    # MPS optimizations
-    pipe.enable_attention_slicing()
-    pipe.enable_vae_slicing()
+    enable_memory_savers(pipe)
 
     console.print("[green]Model loaded successfully.[/green]")
     return pipe
@@ -169,29 +288,82 @@ def generate_base_image(
     return result.images[0]
 
 
-def generate_emotion_image(
+def emotion_batch_size() -> int:
+    """How many emotions to run through img2img per call, by available GPU memory."""
+    if IMAGE_DEVICE != "mps":
+        return 1
+    memory = torch.mps.recommended_max_memory()
+    if memory >= 2 * LOW_MEMORY_BYTES:
+        return 4
+    if memory >= LOW_MEMORY_BYTES:
+        return 2
+    return 1
+
+
+def encode_prompt(
+    pipe: StableDiffusionXLImg2ImgPipeline,
+    prompt: str,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Run both SDXL text encoders once, returning (prompt_embeds, pooled_embeds)."""
+    with torch.no_grad():
+        embeds, _, pooled, _ = pipe.encode_prompt(
+            prompt,
+            device=IMAGE_DEVICE,
+            do_classifier_free_guidance=False,
+        )
+    return embeds, pooled
+
+
+def encode_base_latents(
     pipe_img2img: StableDiffusionXLImg2ImgPipeline,
     base_image: Image.Image,
+) -> torch.Tensor:
+    """VAE-encode the base image once, scaled the way img2img expects.
+
+    img2img takes 4-channel input as ready-made latents and skips its own
+    VAE encode, so every emotion reuses this instead of re-encoding.
+    """
+    vae = pipe_img2img.vae
+    with torch.no_grad():
+        pixels = pipe_img2img.image_processor.preprocess(base_image)
+        pixels = pixels.to(device=IMAGE_DEVICE, dtype=vae.dtype)
+        latents = vae.encode(pixels).latent_dist.mode()
+    return latents * vae.config.scaling_factor
+
+
+def generate_emotion_images(
+    pipe_img2img: StableDiffusionXLImg2ImgPipeline,
+    base_latents: torch.Tensor,
     seed: int,
-    prompt: str,
-    negative_prompt: str,
+    prompt_embeds: list[tuple[torch.Tensor, torch.Tensor]],
+    negative_embeds: tuple[torch.Tensor, torch.Tensor],
     cfg_scale: float,
     num_steps: int,
-) -> Image.Image:
-    """Generate emotion variation using img2img from base."""
-    # Generator must be on CPU for MPS compatibility
-    generator = torch.Generator("cpu").manual_seed(seed)
+) -> list[Image.Image]:
+    """Generate emotion variations using img2img from base, one batched call.
+
+    Takes pre-encoded prompts and base latents (see encode_prompt and
+    encode_base_latents) so neither the text encoders nor the VAE encoder
+    rerun on every call. Each prompt gets its own generator with the
+    same seed, so an emotion renders the same whichever batch it lands in.
+    """
+    count = len(prompt_embeds)
+    # Generators must be on CPU for MPS compatibility
+    generators = [torch.Generator("cpu").manual_seed(seed) for _ in range(count)]
+    negative, negative_pooled = negative_embeds
 
     result = pipe_img2img(
-        prompt=prompt,
-        negative_prompt=negative_prompt,
-        image=base_image,
+        prompt_embeds=torch.cat([embeds for embeds, _ in prompt_embeds]),
+        pooled_prompt_embeds=torch.cat([pooled for _, pooled in prompt_embeds]),
+        negative_prompt_embeds=negative.repeat(count, 1, 1),
+        negative_pooled_prompt_embeds=negative_pooled.repeat(count, 1),
+        image=base_latents.repeat(count, 1, 1, 1),
         strength=IMG2IMG_STRENGTH,
         guidance_scale=cfg_scale,
         num_inference_steps=num_steps,
-        generator=generator,
+        generator=generators,
     )
-    return result.images[0]
+    return result.images
 
 
 def generate_with_retry(
@@ -199,19 +371,45 @@ def generate_with_retry(
     *args,
     max_retries: int = 2,
     **kwargs,
-) -> Image.Image | None:
-    """Attempt generation with retry on failure."""
+) -> Image.Image | list[Image.Image] | None:
+    """Attempt generation with retry on failure.
+
+    Only RuntimeError/MemoryError (OOM, MPS errors) are retried; any other
+    error fails immediately, since a retry would too. A black image is not
+    retried either: the same seed and dtype would reproduce it.
+    """
     for attempt in range(max_retries):
         try:
-            return generate_fn(*args, **kwargs)
-        except Exception as e:
+            # Release cached blocks up front instead of waiting for an OOM
+            if torch.mps.current_allocated_memory() > MPS_HIGH_WATER * torch.mps.recommended_max_memory():
+                gc.collect()
+                torch.mps.empty_cache()
+        except (AttributeError, RuntimeError):
+            pass  # No MPS in this torch build
+
+        try:
+            result = generate_fn(*args, **kwargs)
+        except (RuntimeError, MemoryError) as e:
             if attempt < max_retries - 1:
                 console.print(f"[yellow]Generation failed, retrying...[/yellow]")
+                gc.collect()
                 torch.mps.empty_cache()
-            else:
-                logger.error(f"Generation failed after {max_retries} attempts: {e}")
-                console.print(f"[red]Error: {e}[/red]")
-                return None
+                continue
+            logger.error(f"Generation failed after {max_retries} attempts: {e}")
+            console.print(f"[red]Error: {e}[/red]")
+            return None
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            console.print(f"[red]Error: {e}[/red]")
+            return None
+
+        images = result if isinstance(result, list) else [result]
+        # All-black output is the fp16 NaN symptom, not a real image
+        if any(not any(high for _, high in image.getextrema()) for image in images):
+            logger.error("Generated a black image (fp16 overflow?)")
+            console.print("[red]Error: Generated a black image (fp16 overflow?). Try --fp32.[/red]")
+            return None
+        return result
     return None
 
 
@@ -241,7 +439,7 @@ def main():
     parser.add_argument(
         "--emotion", "-e",
         type=str,
-        choices=EMOTIONS,
+        choices=EMOTIONS_LIST,
         nargs='+',
         help="Generate only specific emotion(s)",
     )
@@ -250,6 +448,22 @@ def main():
         action="store_true",
         help="Generate NSFW emotion images (requires local nsfw_prompts.py config)",
     )
+    parser.add_argument(
+        "--fp32",
+        action="store_true",
+        help="Run in float32 (slower, more memory) if float16 gives black/NaN images",
+    )
+    parser.add_argument(
+        "--deepcache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cached UNet features across denoising steps (~2x faster, default: on)",
+    )
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compile UNet/VAE with torch.compile (slow first emotion; replaces DeepCache)",
+    )
     args = parser.parse_args()
 
     # Check NSFW availability
@@ -265,7 +479,7 @@ def main():
         return
 
     # Determine which emotions to generate
-    target_emotions = args.emotion if args.emotion else EMOTIONS.copy()
+    target_emotions = args.emotion if args.emotion else list(EMOTIONS_LIST)
 
     # Set mode-specific settings
     if args.nsfw:
@@ -328,9 +542,13 @@ def main():
 
     # Load txt2img pipeline
     if args.nsfw:
-        pipe = load_nsfw_pipeline()
+        pipe = load_nsfw_pipeline(fp32=args.fp32)
     else:
-        pipe = load_pipeline()
+        pipe = load_pipeline(fp32=args.fp32)
+    if args.compile:
+        # DeepCache swaps the UNet forward between steps, which defeats a compiled graph
+        compile_pipeline(pipe)
+    deepcache = enable_deepcache(pipe) if args.deepcache and not args.compile else None
 
     # Generate base (neutral) image if needed
     base_image: Image.Image | None = None
@@ -379,17 +597,29 @@ def main():
 
     # Convert to img2img pipeline (reuses components, saves memory)
     console.print("[dim]Converting to img2img pipeline...[/dim]")
+    if deepcache is not None:
+        # Unwrap the shared UNet before handing it to the new pipeline
+        deepcache.disable()
     pipe_img2img = StableDiffusionXLImg2ImgPipeline.from_pipe(pipe)
+    if deepcache is not None:
+        deepcache = enable_deepcache(pipe_img2img)
 
     # Clear txt2img pipe to free memory
     del pipe
     torch.mps.empty_cache()
 
+    # Encode the base image and negative prompt once; emotion prompts on first use
+    base_latents = encode_base_latents(pipe_img2img, base_image)
+    negative_embeds = encode_prompt(pipe_img2img, negative_prompt)
+    emotion_embeds: dict[str, tuple[torch.Tensor, torch.Tensor]] = {}
+
     # Generate remaining emotions
     console.print()
     failed_emotions = []
+    saves = {}
 
-    with Progress(
+    # PNG encoding runs on worker threads while the GPU starts the next batch
+    with ThreadPoolExecutor(max_workers=2) as saver, Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -402,28 +632,42 @@ def main():
             total=len(other_emotions),
         )
 
-        for emotion in other_emotions:
-            progress.update(task, description=f"Generating: {emotion}")
-
-            emotion_prompt = get_nsfw_prompt(emotion) if args.nsfw else get_full_prompt(emotion)
-            image = generate_with_retry(
-                generate_emotion_image,
+        batch_size = emotion_batch_size()
+        for start in range(0, len(other_emotions), batch_size):
+            batch = other_emotions[start:start + batch_size]
+            progress.update(task, description=f"Generating: {', '.join(batch)}")
+
+            for emotion in batch:
+                if emotion not in emotion_embeds:
+                    emotion_prompt = get_nsfw_prompt(emotion) if args.nsfw else get_full_prompt(emotion)
+                    emotion_embeds[emotion] = encode_prompt(pipe_img2img, emotion_prompt)
+            images = generate_with_retry(
+                generate_emotion_images,
                 pipe_img2img,
-                base_image,
+                base_latents,
                 args.seed,
-                emotion_prompt,
-                negative_prompt,
+                [emotion_embeds[emotion] for emotion in batch],
+                negative_embeds,
                 cfg_scale,
                 num_steps,
             )
 
-            if image is not None:
-                image_path = cache_dir / f"{emotion}.png"
-                image.save(image_path)
+            if images is not None:
+                for emotion, image in zip(batch, images):
+                    image_path = cache_dir / f"{emotion}.png"
+                    saves[emotion] = saver.submit(
+                        image.save, image_path, compress_level=PNG_COMPRESS_LEVEL
+                    )
             else:
-                failed_emotions.append(emotion)
+                failed_emotions.extend(batch)
+
+            progress.advance(task, len(batch))
 
-            progress.advance(task)
+    # Executor has shut down, so every save is finished
+    for emotion, save in saves.items():
+        if save.exception() is not None:
+            logger.error(f"Failed to save {emotion}: {save.exception()}")
+            failed_emotions.append(emotion)
 
     # Cleanup
     del pipe_img2img
@@ -1,10 +1,6 @@
 """Voice input handling for Sakura using silero-vad and mlx-whisper."""
 
-import os
-import tempfile
-
 import numpy as np
-import scipy.io.wavfile as wav
 import sounddevice as sd
 import torch
 
@@ -15,12 +11,30 @@ from .config import (
     WHISPER_MODEL,
 )
 
+# VAD chunk size (512 samples for 16kHz = 32ms)
+CHUNK_SAMPLES = 512
+
+# Backup silence threshold: mean |amplitude| in int16 units (0.01 of full scale)
+SILENCE_ENERGY = 328
+
+# Before speech starts, chunks peaking below this are skipped without running VAD
+IDLE_PEAK = 500
+
+# mlx-whisper model repo (e.g., "mlx-community/whisper-small")
+WHISPER_REPO = f"mlx-community/whisper-{WHISPER_MODEL}"
+
 # Module-level state
 _whisper_model = None
 _vad_model = None
 _vad_iterator = None
 _speech_available = False
 
+# Recording buffers, allocated once so the audio loop never allocates.
+# Rounded up to whole chunks so the last read always fits.
+_max_chunks = -(-int(MAX_RECORDING_S * SAMPLE_RATE) // CHUNK_SAMPLES)
+_audio_buffer = np.empty(_max_chunks * CHUNK_SAMPLES, dtype=np.int16)
+_vad_input = torch.empty(CHUNK_SAMPLES, dtype=torch.float32)
+
 
 def _display_status(text: str) -> None:
     """Display status message (lazy import to avoid circular import)."""
@@ -45,12 +59,23 @@ def init() -> None:
 
 
 def _load_vad_model() -> None:
-    """Load silero-vad model via torch.hub (avoids onnxruntime dependency)."""
+    """Load silero-vad model via torch.hub.
+
+    Uses the ONNX export when onnxruntime is installed (faster per 32ms
+    chunk on CPU than the TorchScript model), otherwise TorchScript.
+    """
     global _vad_model, _vad_iterator
 
+    try:
+        import onnxruntime  # noqa: F401
+        use_onnx = True
+    except ImportError:
+        use_onnx = False
+
     _vad_model, utils = torch.hub.load(
         repo_or_dir="snakers4/silero-vad",
         model="silero_vad",
+        onnx=use_onnx,
         trust_repo=True,
     )
     # Get VADIterator from utils
@@ -59,12 +84,18 @@ def _load_vad_model() -> None:
 
 
 def _load_whisper_model() -> None:
-    """Pre-warm mlx-whisper by importing it (model loads on first transcribe)."""
+    """Import mlx-whisper and load the model weights now, not on first listen()."""
     global _whisper_model
 
     import mlx_whisper
     _whisper_model = mlx_whisper  # Store module reference
 
+    # transcribe() looks models up in ModelHolder's cache; fill it with the
+    # same (repo, dtype) it will ask for so the first transcription is warm
+    import mlx.core as mx
+    from mlx_whisper.transcribe import ModelHolder
+    ModelHolder.get_model(WHISPER_REPO, mx.float16)
+
 
 def is_available() -> bool:
     """Check if voice input is available."""
@@ -75,7 +106,8 @@ def _record_until_silence() -> np.ndarray | None:
     """Record audio until silence is detected after speech.
 
     Returns:
-        Audio data as int16 numpy array, or None if no speech detected.
+        Audio data as an int16 view into the shared recording buffer (valid
+        until the next recording), or None if no speech detected.
     """
     if _vad_iterator is None:
         return None
@@ -83,15 +115,14 @@ def _record_until_silence() -> np.ndarray | None:
     # Reset VAD state
     _vad_iterator.reset_states()
 
-    # Calculate chunk size (512 samples for 16kHz = 32ms)
-    chunk_samples = 512
+    chunk_samples = CHUNK_SAMPLES
     max_samples = int(MAX_RECORDING_S * SAMPLE_RATE)
     silence_samples = int(SILENCE_THRESHOLD_S * SAMPLE_RATE)
 
-    audio_chunks: list[np.ndarray] = []
     speech_started = False
     silence_after_speech = 0
-    total_samples = 0
+    total_samples = 0  # Samples read, caps the recording time
+    kept_samples = 0  # Samples kept in the buffer
 
     try:
         with sd.InputStream(
@@ -103,18 +134,21 @@ def _record_until_silence() -> np.ndarray | None:
             while total_samples < max_samples:
                 # Read audio chunk
                 data, _ = stream.read(chunk_samples)
-                audio_chunk = data.flatten()
-                audio_chunks.append(audio_chunk)
-                total_samples += len(audio_chunk)
+                audio_chunk = _audio_buffer[kept_samples:kept_samples + chunk_samples]
+                np.copyto(audio_chunk, data[:, 0])
+                total_samples += chunk_samples
 
-                # Convert to float32 for VAD
-                audio_float = audio_chunk.astype(np.float32) / 32768.0
+                # Idle mic before speech: don't run VAD or keep the chunk
+                # (the next read overwrites it)
+                if not speech_started and np.abs(audio_chunk, dtype=np.int32).max() < IDLE_PEAK:
+                    continue
+                kept_samples += chunk_samples
 
-                # Convert to torch tensor for VAD
-                audio_tensor = torch.from_numpy(audio_float)
+                # Scale into the reusable float32 VAD input, in place
+                _vad_input.copy_(torch.from_numpy(audio_chunk)).mul_(1.0 / 32768.0)
 
                 # Feed to VAD
-                speech_dict = _vad_iterator(audio_tensor, return_seconds=False)
+                speech_dict = _vad_iterator(_vad_input, return_seconds=False)
 
                 if speech_dict:
                     if "start" in speech_dict:
@@ -126,8 +160,9 @@ def _record_until_silence() -> np.ndarray | None:
 
                 # Track silence after speech started (backup detection)
                 if speech_started:
-                    energy = np.abs(audio_float).mean()
-                    if energy < 0.01:
+                    # int32 so abs(-32768) doesn't wrap
+                    energy = np.abs(audio_chunk, dtype=np.int32).mean()
+                    if energy < SILENCE_ENERGY:
                         silence_after_speech += len(audio_chunk)
                     else:
                         silence_after_speech = 0
@@ -139,10 +174,10 @@ def _record_until_silence() -> np.ndarray | None:
         _display_status(f"Recording error: {e}")
         return None
 
-    if not speech_started or len(audio_chunks) == 0:
+    if not speech_started or kept_samples == 0:
         return None
 
-    return np.concatenate(audio_chunks)
+    return _audio_buffer[:kept_samples]
 
 
 def _transcribe(audio: np.ndarray) -> str | None:
@@ -157,20 +192,14 @@ def _transcribe(audio: np.ndarray) -> str | None:
     if _whisper_model is None:
         return None
 
-    temp_path = None
     try:
-        # Create temp file path
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = f.name
-
-        # Write WAV file (after closing the temp file)
-        wav.write(temp_path, SAMPLE_RATE, audio)
+        # mlx-whisper takes 16kHz float32 in [-1, 1] directly, no WAV round-trip
+        audio_float = audio.astype(np.float32) / 32768.0
 
-        # Transcribe using mlx-whisper
-        # path_or_hf_repo specifies the model (e.g., "mlx-community/whisper-small")
+        # Transcribe using mlx-whisper (model already loaded by init)
         result = _whisper_model.transcribe(
-            temp_path,
-            path_or_hf_repo=f"mlx-community/whisper-{WHISPER_MODEL}",
+            audio_float,
+            path_or_hf_repo=WHISPER_REPO,
         )
         return result.get("text", "").strip()
 
@@ -178,10 +207,6 @@ def _transcribe(audio: np.ndarray) -> str | None:
         _display_status(f"Transcription error: {e}")
         return None
 
-    finally:
-        if temp_path and os.path.exists(temp_path):
-            os.unlink(temp_path)
-
 
 def listen() -> str | None:
     """Record and transcribe user speech.
@@ -1,18 +1,23 @@
 """Text-to-speech output for Sakura using Edge TTS."""
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import os
+import queue
 import re
 import logging
+import shutil
+import signal
 import subprocess
 import tempfile
 import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
-import edge_tts
-from pydub import AudioSegment
-
-from .config import TTS_VOICE, TTS_PITCH, TTS_RATE
+from .config import TTS_VOICE, TTS_PITCH, TTS_RATE, TTS_CACHE_DIR, TTS_CACHE_MAX_BYTES
 
 logger = logging.getLogger(__name__)
 
@@ -20,43 +25,172 @@ _current_playback: Optional[subprocess.Popen] = None
 _tts_disabled: bool = False
 _tts_warned: bool = False
 
+# One long-lived event loop for Edge TTS instead of asyncio.run() per utterance
+_tts_loop = asyncio.new_event_loop()
+threading.Thread(target=_tts_loop.run_forever, name="tts-loop", daemon=True).start()
+
+# Players that read mp3 from stdin, so the JP clip can start before synthesis
+# finishes (afplay can't). First one installed wins; with none JP is rendered
+# to the cache first and played by afplay.
+_STREAM_PLAYERS = (
+    ("mpg123", ["-q", "-"]),
+    ("mpv", ["--no-terminal", "--no-video", "-"]),
+    ("ffplay", ["-nodisp", "-autoexit", "-loglevel", "quiet", "-"]),
+)
+
+
+def _find_stream_player() -> list[str] | None:
+    """Command line for the first installed stdin-capable player, if any."""
+    for name, args in _STREAM_PLAYERS:
+        path = shutil.which(name)
+        if path:
+            return [path, *args]
+    return None
+
+
+_STREAM_PLAYER = _find_stream_player()
+
+
+def _run(coro):
+    """Run a coroutine on the TTS event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _tts_loop).result()
+
+
+def _cache_path(text: str) -> Path:
+    """Cache file for text rendered with the current voice settings."""
+    key = hashlib.blake2b(
+        f"{TTS_VOICE}|{TTS_PITCH}|{TTS_RATE}|{text}".encode(), digest_size=12
+    ).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.mp3"
 
+
+def _cache_temp_path() -> Path:
+    """Fresh temp path inside the cache dir, so os.replace into it is atomic."""
+    TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(suffix=".tmp", dir=TTS_CACHE_DIR)
+    os.close(fd)
+    return Path(name)
+
+
+# Eviction trims the cache to this fraction of TTS_CACHE_MAX_BYTES, so the
+# next scan is many renders away rather than on every store once it is full
+_EVICT_TO = 0.9
+
+# Bytes in the TTS cache: counted by the first store, then kept up to date
+# in memory, so the directory is only scanned when the cap is crossed.
+# Only touched on the TTS loop thread.
+_cache_bytes: Optional[int] = None
+
+
+def _evict_tts_cache(limit: float) -> int:
+    """Delete least recently played mp3s until the cache fits limit. Returns the bytes left."""
+    try:
+        entries = [
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(TTS_CACHE_DIR)
+            if entry.name.endswith(".mp3")
+        ]
+    except FileNotFoundError:
+        return 0
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+    return total
+
+
+def _store_in_cache(temp_path: Path, cache_path: Path) -> None:
+    """Move a finished render into the cache and keep the cache bounded."""
+    global _cache_bytes
+    size = temp_path.stat().st_size
+    os.replace(temp_path, cache_path)
+    if _cache_bytes is None:
+        _cache_bytes = _evict_tts_cache(TTS_CACHE_MAX_BYTES)
+    else:
+        _cache_bytes += size
+        if _cache_bytes > TTS_CACHE_MAX_BYTES:
+            _cache_bytes = _evict_tts_cache(TTS_CACHE_MAX_BYTES * _EVICT_TO)
+
+
+def _is_cached(cache_path: Path) -> bool:
+    """True if cache_path holds a finished render; marks it as just played."""
+    try:
+        # Bump mtime: eviction drops the least recently played files first
+        os.utime(cache_path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+# Patterns for _clean_text_for_tts, compiled once.
+# Markup to drop: [EMOTION:xxx] and other [bracket] content, *actions*,
+# (parenthetical notes) -- one alternation, one scan
+_MARKUP_RE = re.compile(r'\[[^\]]*\]|\*[^*]+\*|\([^)]*\)')
+_NOTE_RE = re.compile(r'Note:.*', re.IGNORECASE | re.DOTALL)
+# Pauses: a run of commas/"..." (collapsed to ", ") or a lone "..." (-> ",")
+_PAUSE_RE = re.compile(r'(?:\.\.\.|,)(?:\s*(?:\.\.\.|,))+|\.\.\.')
+
+# Single-character fixes in one pass: drop apostrophes (Nanami mispronounces
+# them as "ichi-juu"), straighten curly double quotes, ellipsis char -> comma
+_CHAR_TABLE = str.maketrans({
+    "'": None,
+    "\u2018": None,
+    "\u2019": None,
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2026": ",",
+})
+
+
+@functools.lru_cache(maxsize=256)
 def _clean_text_for_tts(text: str) -> str:
-    """Remove action markers and problematic characters for TTS."""
-    # Remove [EMOTION:xxx] tags specifically (in case any slipped through)
-    text = re.sub(r'\[EMOTION:\w+\]', '', text, flags=re.IGNORECASE)
-    # Remove any remaining square bracket content [like this] or [action]
-    text = re.sub(r'\[[^\]]+\]', '', text)
-    # Remove asterisk-wrapped actions like *blushes*, *looks away*
-    text = re.sub(r'\*[^*]+\*', '', text)
-    # Remove parenthetical notes like (Note: ...) or (Translation: ...)
-    text = re.sub(r'\([^)]*\)', '', text)
+    """Remove action markers and problematic characters for TTS.
+
+    Pure, so memoized: greetings and stock replies repeat. Each regex pass
+    is skipped when the characters it matches on are absent, so short
+    plain replies never touch the regex engine.
+    """
+    # Remove [EMOTION:xxx]/[action] tags, *blushes*-style actions, (notes)
+    if '[' in text or '*' in text or '(' in text:
+        text = _MARKUP_RE.sub('', text)
     # Remove "Note:" and everything after (LLM commentary)
-    text = re.sub(r'Note:.*', '', text, flags=re.IGNORECASE | re.DOTALL)
-    # Remove apostrophes entirely (Nanami mispronounces them as "ichi-juu")
-    text = text.replace(''', '').replace(''', '').replace("'", '')
-    # Normalize curly quotes to straight
-    text = text.replace('"', '"').replace('"', '"')
-    # Replace ellipsis with comma for natural pause (otherwise reads as "ten-ten")
-    text = text.replace('...', ',')
-    text = text.replace('…', ',')
-    # Collapse adjacent commas to single comma with space (e.g., ", ," → ", ")
-    text = re.sub(r',(\s*,)+', ', ', text)
+    if ':' in text:
+        text = _NOTE_RE.sub('', text)
+    # Apostrophes, curly quotes and the ellipsis character (see _CHAR_TABLE)
+    text = text.translate(_CHAR_TABLE)
+    # Ellipsis -> comma for a natural pause (otherwise reads as "ten-ten"),
+    # and adjacent commas collapse to one (e.g., ", ," -> ", ")
+    if '...' in text or text.count(',') > 1:
+        text = _PAUSE_RE.sub(lambda m: ',' if m.group() == '...' else ', ', text)
     # Clean up extra whitespace
     text = ' '.join(text.split())
     # Remove leading/trailing commas
     return text.strip(' ,')
 
 
+def _communicate(text: str):
+    """Edge TTS request for text with Sakura's voice settings."""
+    # Deferred: edge_tts pulls in aiohttp/ssl, so `import sakura.tts` stays light
+    import edge_tts
+
+    return edge_tts.Communicate(
+        text,
+        TTS_VOICE,
+        pitch=TTS_PITCH,
+        rate=TTS_RATE,
+    )
+
+
 async def _generate_audio(text: str, output_path: Path) -> bool:
     """Generate audio file using Edge TTS."""
     try:
-        communicate = edge_tts.Communicate(
-            text,
-            TTS_VOICE,
-            pitch=TTS_PITCH,
-            rate=TTS_RATE,
-        )
+        communicate = _communicate(text)
         await communicate.save(str(output_path))
         return True
     except Exception as e:
@@ -64,182 +198,270 @@ async def _generate_audio(text: str, output_path: Path) -> bool:
         return False
 
 
+async def _render_to_cache(text: str, cache_path: Path) -> bool:
+    """Render text into the cache. Returns False if synthesis failed."""
+    temp_path = _cache_temp_path()
+    try:
+        if not await _generate_audio(text, temp_path):
+            return False
+        _store_in_cache(temp_path, cache_path)
+        return True
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _write_chunk(stdin, data: bytes) -> None:
+    """Write one chunk to a player's stdin (blocks while the pipe is full)."""
+    stdin.write(data)
+    stdin.flush()
+
+
+async def _stream_audio(
+    text: str, stdin, started: threading.Event, cache_path: Path
+) -> bool:
+    """Stream Edge TTS audio into a player's stdin as chunks arrive.
+
+    Pipe writes run in the loop's executor, so a player that is slow to
+    drain doesn't stall other synthesis on the TTS loop. Also writes the
+    audio to cache_path once the whole utterance has been received. Sets
+    started once the first chunk is written.
+    """
+    loop = asyncio.get_running_loop()
+    temp_path = _cache_temp_path()
+    try:
+        communicate = _communicate(text)
+        with open(temp_path, "wb") as cache_file:
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    cache_file.write(chunk["data"])
+                    await loop.run_in_executor(None, _write_chunk, stdin, chunk["data"])
+                    started.set()
+        _store_in_cache(temp_path, cache_path)
+        return True
+    except BrokenPipeError:
+        # Player was stopped mid-stream (stop_speaking)
+        return True
+    except Exception as e:
+        logger.warning(f"Edge TTS streaming failed: {e}")
+        return False
+    finally:
+        temp_path.unlink(missing_ok=True)
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+
+def _afplay() -> str:
+    """Path to afplay. Raises FileNotFoundError if it isn't installed.
+
+    Checked up front because inside a _play_sequence shell a missing
+    afplay would fail silently instead of raising here.
+    """
+    path = shutil.which("afplay")
+    if path is None:
+        raise FileNotFoundError("afplay")
+    return path
+
+
+def _log_player_exit(process: subprocess.Popen) -> None:
+    """Wait for a playback process and warn if the player failed."""
+    returncode = process.wait()
+    # Negative: stopped by a signal (stop_speaking), not a failure
+    if returncode > 0:
+        logger.warning(f"Audio player exited with status {returncode}")
+
+
+# One reaper thread for all playbacks instead of a thread per utterance.
+# Waiting serially is fine: speak_bilingual() stops the previous playback first.
+_exit_queue: "queue.SimpleQueue[tuple[subprocess.Popen]]" = queue.SimpleQueue()
+
+
+def _exit_worker() -> None:
+    """Wait on queued playbacks in order and log failed players."""
+    while True:
+        _log_player_exit(*_exit_queue.get())
+
+
+threading.Thread(target=_exit_worker, name="tts-reaper", daemon=True).start()
+
+
 def _play_audio(audio_path: Path) -> subprocess.Popen:
     """Start afplay in background."""
     return subprocess.Popen(
-        ["afplay", str(audio_path)],
+        [_afplay(), str(audio_path)],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
 
 
-def _cleanup_temp_file(path: Path, process: subprocess.Popen) -> None:
-    """Wait for process and clean up temp file."""
-    try:
-        process.wait()
-    except Exception:
-        pass
-    try:
-        path.unlink(missing_ok=True)
-    except Exception:
-        pass
-
-
-def stop_speaking() -> None:
-    """Stop any currently playing audio."""
-    global _current_playback
-    if _current_playback is not None:
-        try:
-            _current_playback.terminate()
-        except Exception:
-            pass
-        _current_playback = None
+def _stream_player() -> subprocess.Popen:
+    """Start the stream player in background, reading mp3 from stdin."""
+    return subprocess.Popen(
+        _STREAM_PLAYER,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
 
-def is_speaking() -> bool:
-    """Check if audio is currently playing."""
-    if _current_playback is None:
-        return False
-    return _current_playback.poll() is None
+# $1 is afplay, $2 the second clip, the rest the first player's command line.
+# A failed EN render (EOF on the release pipe) ends the sequence with status 0.
+_SEQUENCE_SCRIPT = (
+    'afplay=$1 second=$2; shift 2; "$@" && sleep 0.5 &&'
+    ' if read -r _ <&{fd}; then "$afplay" "$second"; fi'
+)
 
 
-def speak(text: str) -> Optional[str]:
-    """Convert text to speech and play (non-blocking).
+def _play_sequence(
+    first: list[str], second: Path, stream: bool
+) -> tuple[subprocess.Popen, BinaryIO]:
+    """Run a player command, then play second after a 0.5s pause, as one background process.
 
-    Returns None on success, or a warning message on first failure.
+    The second file may still be generating: before playing it the process
+    waits for a line on the returned release pipe (see _release_second_clip),
+    and stops at EOF. With stream, the first player reads from the process's
+    stdin.
     """
-    global _tts_disabled, _current_playback, _tts_warned
-
-    if _tts_disabled:
-        return None
+    release_read, release_write = os.pipe()
+    try:
+        process = subprocess.Popen(
+            [
+                "sh", "-c", _SEQUENCE_SCRIPT.format(fd=release_read),
+                "sh", _afplay(), str(second), *first,
+            ],
+            stdin=subprocess.PIPE if stream else subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=(release_read,),
+            # Own process group, so stop_speaking() can stop the players inside too
+            start_new_session=True,
+        )
+    except OSError:
+        os.close(release_write)
+        raise
+    finally:
+        os.close(release_read)
+    return process, os.fdopen(release_write, "wb")
 
-    stop_speaking()
 
-    audio_path: Optional[Path] = None
+def _release_second_clip(release: BinaryIO, future) -> None:
+    """Let a _play_sequence go on to its second clip, or end it if generation failed."""
     try:
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-            audio_path = Path(f.name)
-
-        if not asyncio.run(_generate_audio(_clean_text_for_tts(text), audio_path)):
-            audio_path.unlink(missing_ok=True)
-            if not _tts_warned:
-                _tts_warned = True
-                return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
-            return None
+        if future.result():
+            release.write(b"\n")
+    except Exception:
+        pass  # Playback already stopped, or generation raised
+    finally:
+        try:
+            release.close()
+        except OSError:
+            pass
 
-        _current_playback = _play_audio(audio_path)
 
-        threading.Thread(
-            target=_cleanup_temp_file,
-            args=(audio_path, _current_playback),
-            daemon=True,
-        ).start()
-        return None
+def _stop_process(process: subprocess.Popen) -> None:
+    """Stop a playback process, and everything in its group if it leads one."""
+    try:
+        if os.getpgid(process.pid) == process.pid:
+            # Group leader (_play_sequence): stop the whole sequence
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+    except Exception:
+        pass
 
-    except FileNotFoundError:
-        logger.error("afplay not found - TTS disabled")
-        _tts_disabled = True
-        if audio_path:
-            audio_path.unlink(missing_ok=True)
-        if not _tts_warned:
-            _tts_warned = True
-            return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
-        return None
-    except Exception as e:
-        logger.warning(f"TTS failed: {e}")
-        if audio_path:
-            audio_path.unlink(missing_ok=True)
-        return None
 
+def stop_speaking() -> None:
+    """Stop any currently playing audio."""
+    global _current_playback
+    if _current_playback is not None:
+        _stop_process(_current_playback)
+        _current_playback = None
 
-async def _generate_bilingual_audio(
-    japanese: str, english: str
-) -> tuple[Path | None, Path | None]:
-    """Generate audio files for both languages in parallel."""
-    jp_path = Path(tempfile.mktemp(suffix="_jp.mp3"))
-    en_path = Path(tempfile.mktemp(suffix="_en.mp3"))
 
-    # Clean text for TTS
-    jp_clean = _clean_text_for_tts(japanese) if japanese else ""
-    en_clean = _clean_text_for_tts(english) if english else ""
+# is_speaking() reuses a poll() result this young (seconds) for the same playback
+_SPEAKING_POLL_TTL = 0.05
+# (playback, time.monotonic() of the poll, alive) from the last real poll
+_speaking_poll: tuple[Optional[subprocess.Popen], float, bool] = (None, 0.0, False)
 
-    # Generate both audio files in parallel
-    tasks = []
-    if jp_clean:
-        tasks.append(_generate_audio(jp_clean, jp_path))
-    if en_clean:
-        tasks.append(_generate_audio(en_clean, en_path))
 
-    if not tasks:
-        return None, None
+def is_speaking() -> bool:
+    """Check if audio is currently playing.
 
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    Rapid repeat checks (e.g. from an animation loop) share one poll()
+    per _SPEAKING_POLL_TTL; a new playback always gets a fresh poll.
+    """
+    global _speaking_poll
+    process = _current_playback
+    if process is None:
+        return False
 
-    # Determine which succeeded
-    jp_success = False
-    en_success = False
-    result_idx = 0
+    now = time.monotonic()
+    polled, polled_at, alive = _speaking_poll
+    if polled is process and now - polled_at < _SPEAKING_POLL_TTL:
+        return alive
 
-    if jp_clean:
-        jp_success = results[result_idx] is True
-        result_idx += 1
-    if en_clean:
-        en_success = results[result_idx] is True
+    alive = process.poll() is None
+    _speaking_poll = (process, now, alive)
+    return alive
 
-    return (
-        jp_path if jp_success else None,
-        en_path if en_success else None,
-    )
 
+def speak(text: str) -> Optional[str]:
+    """Convert text to speech and play (non-blocking).
 
-def _concatenate_audio(jp_path: Path | None, en_path: Path | None) -> Path | None:
-    """Concatenate JP + silence + EN audio into single file."""
-    jp_segment = None
-    en_segment = None
+    Returns None on success, or a warning message on first failure.
+    """
+    return speak_bilingual("", text)
 
-    # Load JP audio if available
-    if jp_path and jp_path.exists():
-        try:
-            jp_segment = AudioSegment.from_mp3(str(jp_path))
-        except Exception as e:
-            logger.warning(f"Failed to load JP audio: {e}")
 
-    # Load EN audio if available
-    if en_path and en_path.exists():
-        try:
-            en_segment = AudioSegment.from_mp3(str(en_path))
-        except Exception as e:
-            logger.warning(f"Failed to load EN audio: {e}")
+def _start_japanese(jp_text: str, en_future, en_path: Path) -> Optional[subprocess.Popen]:
+    """Start JP playback, followed by EN once en_future is done (if any).
 
-    # Build combined audio
-    if not jp_segment and not en_segment:
+    A cached clip plays straight away. Otherwise, with a stream player, JP
+    plays while it is still being synthesized; without one it is rendered
+    into the cache first and played with afplay. Returns None if JP
+    synthesis failed.
+    """
+    jp_path = _cache_path(jp_text)
+    if _is_cached(jp_path):
+        first, stream = [_afplay(), str(jp_path)], False
+    elif _STREAM_PLAYER:
+        first, stream = _STREAM_PLAYER, True
+    elif _run(_render_to_cache(jp_text, jp_path)):
+        first, stream = [_afplay(), str(jp_path)], False
+    else:
         return None
 
-    segments = []
-    if jp_segment:
-        segments.append(jp_segment)
-    if jp_segment and en_segment:
-        segments.append(AudioSegment.silent(duration=500))  # 0.5s pause
-    if en_segment:
-        segments.append(en_segment)
-
-    # Combine all segments
-    combined = segments[0]
-    for segment in segments[1:]:
-        combined = combined + segment
+    if en_future is None:
+        process = _stream_player() if stream else _play_audio(jp_path)
+    else:
+        process, release = _play_sequence(first, en_path, stream)
+        en_future.add_done_callback(functools.partial(_release_second_clip, release))
 
-    # Export to temp file
-    output_path = Path(tempfile.mktemp(suffix="_combined.mp3"))
-    combined.export(str(output_path), format="mp3")
-
-    return output_path
+    if stream:
+        started = threading.Event()
+        future = asyncio.run_coroutine_threadsafe(
+            _stream_audio(jp_text, process.stdin, started, jp_path), _tts_loop
+        )
+        # Also wake up when the stream ends, so a failure before any audio is
+        # seen here: the callback runs only once the result is set
+        future.add_done_callback(lambda _: started.set())
+        # Wait only for the first audio so failures still surface to the caller
+        started.wait()
+        if future.done() and not future.result():
+            _stop_process(process)
+            return None
+    return process
 
 
 def speak_bilingual(japanese: str, english: str) -> Optional[str]:
     """Convert bilingual text to speech and play (non-blocking).
 
-    Generates JP and EN audio in parallel, concatenates with 0.5s pause.
-    Graceful degradation: plays whatever audio succeeds.
+    Generates JP and EN audio in parallel. JP starts playing as soon as
+    its first audio arrives; EN follows after a 0.5s pause once it has
+    been generated. Each language's clip is cached, so repeated lines
+    (greetings, short replies) skip synthesis. Graceful degradation:
+    plays whatever audio succeeds.
 
     Returns None on success, or a warning message on first failure.
     """
@@ -248,63 +470,53 @@ def speak_bilingual(japanese: str, english: str) -> Optional[str]:
     if _tts_disabled:
         return None
 
-    stop_speaking()
-
-    jp_path: Optional[Path] = None
-    en_path: Optional[Path] = None
-    combined_path: Optional[Path] = None
-
-    try:
-        # Generate audio files in parallel
-        jp_path, en_path = asyncio.run(_generate_bilingual_audio(japanese, english))
-
-        # If both failed
-        if not jp_path and not en_path:
-            if not _tts_warned:
-                _tts_warned = True
-                return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
-            return None
+    # Empty turn: nothing to synthesize (and not a TTS failure)
+    if not (japanese and japanese.strip()) and not (english and english.strip()):
+        return None
 
-        # Concatenate available audio
-        combined_path = _concatenate_audio(jp_path, en_path)
+    jp_clean = _clean_text_for_tts(japanese) if japanese else ""
+    en_clean = _clean_text_for_tts(english) if english else ""
+    if not jp_clean and not en_clean:
+        return None
 
-        # Clean up individual files
-        if jp_path:
-            jp_path.unlink(missing_ok=True)
-        if en_path:
-            en_path.unlink(missing_ok=True)
+    stop_speaking()
 
-        if not combined_path:
-            if not _tts_warned:
-                _tts_warned = True
-                return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
+    try:
+        # Start EN now; it renders on the TTS loop while JP is synthesized
+        en_future = None
+        en_path = _cache_path(en_clean)
+        if en_clean and _is_cached(en_path):
+            en_future = concurrent.futures.Future()
+            en_future.set_result(True)
+        elif en_clean:
+            en_future = asyncio.run_coroutine_threadsafe(
+                _render_to_cache(en_clean, en_path), _tts_loop
+            )
+
+        if jp_clean:
+            _current_playback = _start_japanese(jp_clean, en_future, en_path)
+            if _current_playback is not None:
+                _exit_queue.put((_current_playback,))
+                return None
+
+        if en_future is not None and en_future.result():
+            _current_playback = _play_audio(en_path)
+            _exit_queue.put((_current_playback,))
             return None
 
-        # Play combined audio
-        _current_playback = _play_audio(combined_path)
-
-        # Clean up after playback
-        threading.Thread(
-            target=_cleanup_temp_file,
-            args=(combined_path, _current_playback),
-            daemon=True,
-        ).start()
-
+        # Both failed
+        if not _tts_warned:
+            _tts_warned = True
+            return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
         return None
 
     except FileNotFoundError:
         logger.error("afplay not found - TTS disabled")
         _tts_disabled = True
-        for path in [jp_path, en_path, combined_path]:
-            if path:
-                path.unlink(missing_ok=True)
         if not _tts_warned:
             _tts_warned = True
             return "Hmph, my voice isn't working today... N-not that I wanted to talk to you anyway!"
         return None
     except Exception as e:
         logger.warning(f"Bilingual TTS failed: {e}")
-        for path in [jp_path, en_path, combined_path]:
-            if path:
-                path.unlink(missing_ok=True)
         return None
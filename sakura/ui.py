@@ -1,5 +1,7 @@
 """Rich terminal interface for Sakura."""
 
+import codecs
+import os
 import sys
 import termios
 import tty
@@ -27,6 +29,25 @@ SAKURA_THEME = Theme({
 
 console = Console(theme=SAKURA_THEME)
 
+# Static panel headers, styled once (Panel copies its title when rendering)
+_SAKURA_HEADER = Text("🌸 Sakura", style="sakura.name")
+_USER_HEADER = Text("You", style="user.name")
+
+# Emotion image already shown for the pending message (see preview_emotion)
+_previewed_emotion: str | None = None
+
+
+def preview_emotion(emotion: str) -> None:
+    """Show the emotion image early, while the response is still streaming.
+
+    display_bilingual_message skips the image if it matches the preview.
+    """
+    global _previewed_emotion
+    if emotion == _previewed_emotion:
+        return
+    display_emotion(emotion)
+    _previewed_emotion = emotion
+
 
 def display_bilingual_message(emotion: str, japanese: str, english: str) -> None:
     """Display Sakura's bilingual message in JRPG style.
@@ -36,14 +57,16 @@ def display_bilingual_message(emotion: str, japanese: str, english: str) -> None
     - Japanese text (bright white)
     - English text (dim gray)
     """
-    # Display emotion image first
-    display_emotion(emotion)
+    global _previewed_emotion
+
+    # Display emotion image first (unless already previewed during streaming)
+    if emotion != _previewed_emotion:
+        display_emotion(emotion)
+    _previewed_emotion = None
 
     # Build header
-    header = Text()
-    header.append("🌸 Sakura", style="sakura.name")
-    header.append(" ", style="default")
-    header.append(f"[{emotion}]", style="sakura.emotion")
+    header = _SAKURA_HEADER.copy()
+    header.append(f" [{emotion}]", style="sakura.emotion")
 
     # Build content with both languages
     content = Text()
@@ -65,12 +88,9 @@ def display_bilingual_message(emotion: str, japanese: str, english: str) -> None
 
 def display_user_message(text: str) -> None:
     """Display a user message."""
-    header = Text()
-    header.append("You", style="user.name")
-
     panel = Panel(
         Text(text, style="user"),
-        title=header,
+        title=_USER_HEADER,
         title_align="left",
         border_style="cyan",
         padding=(0, 1),
@@ -91,6 +111,13 @@ def get_input() -> str:
         raise
 
 
+# Keystrokes read past an Enter (e.g. a multi-line paste) or the space that
+# starts voice input, used by the next prompt
+_pending_input = ""
+# Raw reads can split a multi-byte character; the decoder carries it over
+_stdin_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
 def get_input_with_voice() -> tuple[str, Literal["text", "voice"]]:
     """Get user input, supporting both text and voice.
 
@@ -100,6 +127,8 @@ def get_input_with_voice() -> tuple[str, Literal["text", "voice"]]:
     Returns:
         Tuple of (user_text, input_mode).
     """
+    global _pending_input
+
     from .speech import is_available, listen
 
     # Show prompt with voice hint if available
@@ -116,43 +145,60 @@ def get_input_with_voice() -> tuple[str, Literal["text", "voice"]]:
         buffer: list[str] = []
 
         while True:
-            char = sys.stdin.read(1)
-
-            # Space as first char = voice input
-            if char == " " and not buffer and is_available():
-                console.print()  # New line
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-
-                text = listen()
-                if text:
-                    return text, "voice"
-                else:
-                    # Fallback to text input
-                    display_status("Please type instead")
-                    return get_input(), "text"
-
-            # Enter = submit
-            elif char in ("\n", "\r"):
-                console.print()  # New line
-                return "".join(buffer).strip(), "text"
-
-            # Backspace
-            elif char == "\x7f":
-                if buffer:
-                    buffer.pop()
-                    sys.stdout.write("\b \b")
-                    sys.stdout.flush()
-
-            # Ctrl+C
-            elif char == "\x03":
-                console.print()
-                raise KeyboardInterrupt
-
-            # Regular character
+            # One read per keypress or whole paste, not one per character
+            if _pending_input:
+                chunk, _pending_input = _pending_input, ""
             else:
-                buffer.append(char)
-                sys.stdout.write(char)
-                sys.stdout.flush()
+                data = os.read(fd, 1024)
+                if not data:  # EOF
+                    console.print()
+                    return "".join(buffer).strip(), "text"
+                chunk = _stdin_decoder.decode(data)
+            echo: list[str] = []
+
+            for i, char in enumerate(chunk):
+                # Space as first char = voice input
+                if char == " " and not buffer and is_available():
+                    sys.stdout.write("".join(echo))
+                    console.print()  # New line
+                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                    _pending_input = chunk[i + 1:]
+
+                    text = listen()
+                    if text:
+                        return text, "voice"
+                    else:
+                        # Fallback to text input
+                        display_status("Please type instead")
+                        return get_input(), "text"
+
+                # Enter = submit
+                elif char in ("\n", "\r"):
+                    sys.stdout.write("".join(echo))
+                    console.print()  # New line
+                    _pending_input = chunk[i + 1:]
+                    return "".join(buffer).strip(), "text"
+
+                # Backspace
+                elif char == "\x7f":
+                    if buffer:
+                        buffer.pop()
+                        echo.append("\b \b")
+
+                # Ctrl+C
+                elif char == "\x03":
+                    sys.stdout.write("".join(echo))
+                    console.print()
+                    raise KeyboardInterrupt
+
+                # Regular character
+                else:
+                    buffer.append(char)
+                    echo.append(char)
+
+            # Echo the whole chunk at once
+            sys.stdout.write("".join(echo))
+            sys.stdout.flush()
 
     finally:
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)